@@ -3,7 +3,6 @@ import aiohttp
 import asyncio
 import logging
 from typing import List, Optional
-from datetime import datetime, timedelta
 
 from arxivscribe.arxiv.parser import ArxivParser
 
@@ -20,6 +19,20 @@ class ArxivFetcher:
         self.rate_limit_seconds = rate_limit_seconds
         self.parser = ArxivParser()
         self._last_request_time: Optional[float] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session, so requests to arXiv reuse kept-alive connections."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def _rate_limit(self):
         """Respect arXiv's rate limit (they ask for 3s between requests)."""
@@ -56,33 +69,28 @@ class ArxivFetcher:
     async def fetch_papers(
         self,
         categories: List[str],
-        since: Optional[datetime] = None,
         max_results: Optional[int] = None
     ) -> List[dict]:
         """
-        Fetch papers from arXiv for given categories.
+        Fetch the latest papers from arXiv for given categories.
 
-        Note: arXiv's submittedDate query is unreliable, so we fetch recent papers
-        and filter by date post-fetch.
+        Callers drop already-stored papers (DatabaseManager.get_stored_ids).
         """
-        if since is None:
-            since = datetime.utcnow() - timedelta(days=1)
-
         max_per_cat = max_results or self.max_results_per_category
         all_papers = []
         seen_ids = set()
 
-        async with aiohttp.ClientSession() as session:
-            for category in categories:
-                try:
-                    papers = await self._fetch_category(session, category, max_per_cat)
-                    for paper in papers:
-                        if paper['id'] not in seen_ids:
-                            all_papers.append(paper)
-                            seen_ids.add(paper['id'])
-                    logger.info(f"Fetched {len(papers)} papers from {category}")
-                except Exception as e:
-                    logger.error(f"Error fetching category {category}: {e}")
+        session = await self._get_session()
+        for category in categories:
+            try:
+                papers = await self._fetch_category(session, category, max_per_cat)
+                for paper in papers:
+                    if paper['id'] not in seen_ids:
+                        all_papers.append(paper)
+                        seen_ids.add(paper['id'])
+                logger.info(f"Fetched {len(papers)} papers from {category}")
+            except Exception as e:
+                logger.error(f"Error fetching category {category}: {e}")
 
         logger.info(f"Total unique papers fetched: {len(all_papers)}")
         return all_papers
@@ -112,11 +120,11 @@ class ArxivFetcher:
         """Fetch a specific paper by arXiv ID."""
         params = {"id_list": arxiv_id, "max_results": 1}
         try:
-            async with aiohttp.ClientSession() as session:
-                xml_content = await self._request_with_retry(session, self.BASE_URL, params)
-                if xml_content:
-                    papers = self.parser.parse_response(xml_content)
-                    return papers[0] if papers else None
+            session = await self._get_session()
+            xml_content = await self._request_with_retry(session, self.BASE_URL, params)
+            if xml_content:
+                papers = self.parser.parse_response(xml_content)
+                return papers[0] if papers else None
         except Exception as e:
             logger.error(f"Error fetching paper {arxiv_id}: {e}")
         return None
@@ -131,10 +139,10 @@ class ArxivFetcher:
             "sortOrder": "descending"
         }
         try:
-            async with aiohttp.ClientSession() as session:
-                xml_content = await self._request_with_retry(session, self.BASE_URL, params)
-                if xml_content:
-                    return self.parser.parse_response(xml_content)
+            session = await self._get_session()
+            xml_content = await self._request_with_retry(session, self.BASE_URL, params)
+            if xml_content:
+                return self.parser.parse_response(xml_content)
         except Exception as e:
             logger.error(f"Error searching arXiv for '{query}': {e}")
         return []
@@ -1,9 +1,15 @@
 """Parser for arXiv API XML responses."""
-import xml.etree.ElementTree as ET
 import logging
 from typing import List
 from datetime import datetime
 
+try:
+    from lxml import etree as ET  # optional: pip install arxivscribe[fast]
+    _XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +33,8 @@ class ArxivParser:
         papers = []
         
         try:
-            root = ET.fromstring(xml_content)
+            # Bytes, because lxml rejects str input that carries an encoding declaration
+            root = ET.fromstring(xml_content.encode(), _XML_PARSER)
             
             # Find all entry elements
             entries = root.findall(f"{self.ATOM_NS}entry")
@@ -1,11 +1,70 @@
 """Keyword filtering and matching for papers."""
+import functools
 import re
-from typing import List, Set
+from typing import Dict, List, Set
 import logging
 
+try:
+    import ahocorasick  # optional: pip install arxivscribe[filters]
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+class KeywordMatcher:
+    """Matches one keyword list against many texts.
+
+    Built once per batch. With pyahocorasick installed, a single automaton pass
+    over each text finds every candidate keyword; otherwise each keyword is a
+    substring check. Fuzzy (word-boundary) matching is then confirmed with a
+    precompiled regex only for the candidates.
+    """
+
+    def __init__(self, keywords: List[str], fuzzy: bool = True):
+        self.fuzzy = fuzzy
+        # normalized keyword -> the caller's spellings of it
+        self._by_norm: Dict[str, List[str]] = {}
+        for keyword in keywords:
+            self._by_norm.setdefault(KeywordFilter.normalize_text(keyword), []).append(keyword)
+        self._patterns = {
+            norm: re.compile(r'\b' + re.escape(norm) + r'\b', re.IGNORECASE)
+            for norm in self._by_norm
+        } if fuzzy else {}
+        self._automaton = None
+        words = [norm for norm in self._by_norm if norm]
+        if ahocorasick is not None and words:
+            self._automaton = ahocorasick.Automaton()
+            for norm in words:
+                self._automaton.add_word(norm, norm)
+            self._automaton.make_automaton()
+
+    def _candidates(self, text: str):
+        if self._automaton is None:
+            return [norm for norm in self._by_norm if norm in text]
+        found = {norm for _, norm in self._automaton.iter(text)}
+        if '' in self._by_norm:
+            found.add('')
+        return found
+
+    def match(self, text: str) -> Set[str]:
+        """Keywords (as originally given) that occur in `text`."""
+        return self.match_normalized(KeywordFilter.normalize_text(text))
+
+    def match_normalized(self, text: str) -> Set[str]:
+        """Like `match`, for text already passed through normalize_text."""
+        matched = set()
+        for norm in self._candidates(text):
+            if not self.fuzzy or self._patterns[norm].search(text):
+                matched.update(self._by_norm[norm])
+        return matched
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_matcher(keywords: tuple, fuzzy: bool) -> KeywordMatcher:
+    return KeywordMatcher(list(keywords), fuzzy=fuzzy)
+
+
 class KeywordFilter:
     """Handles keyword matching and filtering for papers."""
 
@@ -63,21 +122,23 @@ class KeywordFilter:
         Returns:
             Set of matched keywords (empty if no matches)
         """
-        matched_keywords = set()
-        
-        # Combine searchable text
-        searchable_text = " ".join([
+        matcher = _cached_matcher(tuple(keywords), fuzzy)
+        return matcher.match_normalized(KeywordFilter.haystack(paper))
+
+    @staticmethod
+    def searchable_text(paper: dict) -> str:
+        """Title, abstract, summary and categories joined into one haystack."""
+        return " ".join([
             paper.get('title', ''),
             paper.get('abstract', ''),
             paper.get('summary', ''),
             " ".join(paper.get('categories', []))
         ])
-        
-        for keyword in keywords:
-            if KeywordFilter.matches_keyword(searchable_text, keyword, fuzzy=fuzzy):
-                matched_keywords.add(keyword)
-        
-        return matched_keywords
+
+    @staticmethod
+    def haystack(paper: dict) -> str:
+        """searchable_text already passed through normalize_text, for match_normalized."""
+        return KeywordFilter.normalize_text(KeywordFilter.searchable_text(paper))
 
     @staticmethod
     def filter_papers_by_keywords(
@@ -97,9 +158,10 @@ class KeywordFilter:
             List of tuples (paper, matched_keywords)
         """
         filtered = []
+        matcher = _cached_matcher(tuple(keywords), fuzzy)
         
         for paper in papers:
-            matched = KeywordFilter.paper_matches_keywords(paper, keywords, fuzzy=fuzzy)
+            matched = matcher.match_normalized(KeywordFilter.haystack(paper))
             if matched:
                 filtered.append((paper, matched))
                 logger.debug(
@@ -28,15 +28,15 @@ def _find_config():
 
 def _load_deps(config_path=None):
     """Load config, DB, fetcher, summarizer."""
-    import yaml
     from dotenv import load_dotenv
+    from arxivscribe.config import parse_yaml
     load_dotenv()
 
     if config_path is None:
         config_path = _find_config()
     if config_path and os.path.exists(config_path):
         with open(config_path) as f:
-            config = yaml.safe_load(f)
+            config = parse_yaml(f)
     else:
         config = {}
 
@@ -60,17 +60,13 @@ async def _get_fetcher(config):
     )
 
 
-async def _get_summarizer(config):
+async def _get_summarizer(config, cache=None):
     from arxivscribe.llm.summarizer import Summarizer
     llm_cfg = config.get('llm', {})
     provider = llm_cfg.get('provider', 'openai')
 
-    # Try multiple API key sources
-    api_key = None
-    for env_var in [f"{provider.upper()}_API_KEY", "OPENAI_API_KEY"]:
-        api_key = os.getenv(env_var)
-        if api_key:
-            break
+    from arxivscribe.env import Env
+    api_key = Env.from_environ().api_key(provider)
 
     if not api_key:
         return None
@@ -79,7 +75,8 @@ async def _get_summarizer(config):
         return Summarizer(
             provider=provider, api_key=api_key,
             model=llm_cfg.get('model'),
-            max_concurrent=llm_cfg.get('max_concurrent', 5)
+            max_concurrent=llm_cfg.get('max_concurrent', 5),
+            cache=cache,
         )
     except Exception:
         return None
@@ -103,64 +100,62 @@ def fetch(categories, keywords, limit, no_summarize):
         config = _load_deps()
         db = await _get_db(config)
         fetcher = await _get_fetcher(config)
+        try:
+            cats = categories.split(',') if categories else config.get('arxiv', {}).get('categories', ['cs.LG', 'cs.AI'])
 
-        cats = categories.split(',') if categories else config.get('arxiv', {}).get('categories', ['cs.LG', 'cs.AI'])
+            with console.status("[bold blue]Fetching papers from arXiv..."):
+                papers = await fetcher.fetch_papers(categories=cats, max_results=limit)
 
-        with console.status("[bold blue]Fetching papers from arXiv..."):
-            papers = await fetcher.fetch_papers(categories=cats, max_results=limit)
+            if not papers:
+                console.print("[yellow]No papers found.[/yellow]")
+                return
 
-        if not papers:
-            console.print("[yellow]No papers found.[/yellow]")
-            await db.close()
-            return
+            console.print(f"[green]Fetched {len(papers)} papers[/green]")
 
-        console.print(f"[green]Fetched {len(papers)} papers[/green]")
-
-        # Filter by keywords
-        if keywords:
-            from arxivscribe.bot.filters import KeywordFilter
-            kw_list = [k.strip() for k in keywords.split(',')]
-            filtered = KeywordFilter.filter_papers_by_keywords(papers, kw_list)
-            papers = [p for p, _ in filtered]
-            console.print(f"[blue]Filtered to {len(papers)} papers matching: {', '.join(kw_list)}[/blue]")
-        else:
-            # Use stored subscriptions
-            subs = await db.get_channel_subscriptions(0, 0)
-            if subs:
+            # Filter by keywords
+            if keywords:
                 from arxivscribe.bot.filters import KeywordFilter
-                filtered = KeywordFilter.filter_papers_by_keywords(papers, subs)
+                kw_list = [k.strip() for k in keywords.split(',')]
+                filtered = KeywordFilter.filter_papers_by_keywords(papers, kw_list)
                 papers = [p for p, _ in filtered]
-                console.print(f"[blue]Filtered to {len(papers)} papers matching subscriptions: {', '.join(subs)}[/blue]")
-
-        if not papers:
-            console.print("[yellow]No papers matched filters.[/yellow]")
-            await db.close()
-            return
-
-        # Summarize
-        if not no_summarize:
-            summarizer = await _get_summarizer(config)
-            if summarizer:
-                with console.status("[bold blue]Generating AI summaries..."):
-                    papers = await summarizer.batch_summarize(papers)
-                console.print(f"[green]Summarized {len(papers)} papers[/green]")
+                console.print(f"[blue]Filtered to {len(papers)} papers matching: {', '.join(kw_list)}[/blue]")
             else:
-                console.print("[dim]No API key — skipping summaries (set OPENAI_API_KEY for AI summaries)[/dim]")
-
-        # Store
-        stored = 0
-        for paper in papers:
-            if not await db.is_paper_stored(paper['id']):
-                await db.store_paper_local(paper)
-                stored += 1
-
-        await db.update_last_fetch_time()
-        console.print(f"[green bold]Done![/green bold] {stored} new papers stored, {len(papers) - stored} already in DB")
-
-        # Show top 5
-        _print_papers(papers[:5])
-
-        await db.close()
+                # Use stored subscriptions
+                subs = await db.get_channel_subscriptions(0, 0)
+                if subs:
+                    from arxivscribe.bot.filters import KeywordFilter
+                    filtered = KeywordFilter.filter_papers_by_keywords(papers, subs)
+                    papers = [p for p, _ in filtered]
+                    console.print(f"[blue]Filtered to {len(papers)} papers matching subscriptions: {', '.join(subs)}[/blue]")
+
+            if not papers:
+                console.print("[yellow]No papers matched filters.[/yellow]")
+                return
+
+            # Summarize
+            if not no_summarize:
+                summarizer = await _get_summarizer(config, cache=db)
+                if summarizer:
+                    with console.status("[bold blue]Generating AI summaries..."):
+                        papers = await summarizer.batch_summarize(papers)
+                    console.print(f"[green]Summarized {len(papers)} papers[/green]")
+                else:
+                    console.print("[dim]No API key — skipping summaries (set OPENAI_API_KEY for AI summaries)[/dim]")
+
+            # Store
+            stored_ids = await db.get_stored_ids([p['id'] for p in papers])
+            new_papers = [p for p in papers if p['id'] not in stored_ids]
+            await db.store_papers_local_batch(new_papers)
+            stored = len(new_papers)
+
+            await db.update_last_fetch_time()
+            console.print(f"[green bold]Done![/green bold] {stored} new papers stored, {len(papers) - stored} already in DB")
+
+            # Show top 5
+            _print_papers(papers[:5])
+        finally:
+            await fetcher.close()
+            await db.close()
 
     asyncio.run(_run())
 
@@ -174,22 +169,24 @@ def search(query, count, summarize):
     async def _run():
         config = _load_deps()
         fetcher = await _get_fetcher(config)
-
-        with console.status(f"[bold blue]Searching arXiv for '{query}'..."):
-            papers = await fetcher.search_papers(query, max_results=count)
-
-        if not papers:
-            console.print(f"[yellow]No papers found for '{query}'[/yellow]")
-            return
-
-        if summarize:
-            summarizer = await _get_summarizer(config)
-            if summarizer:
-                with console.status("[bold blue]Generating summaries..."):
-                    papers = await summarizer.batch_summarize(papers)
-
-        console.print(f"\n[bold]Found {len(papers)} papers for '[cyan]{query}[/cyan]':[/bold]\n")
-        _print_papers(papers)
+        try:
+            with console.status(f"[bold blue]Searching arXiv for '{query}'..."):
+                papers = await fetcher.search_papers(query, max_results=count)
+
+            if not papers:
+                console.print(f"[yellow]No papers found for '{query}'[/yellow]")
+                return
+
+            if summarize:
+                summarizer = await _get_summarizer(config)
+                if summarizer:
+                    with console.status("[bold blue]Generating summaries..."):
+                        papers = await summarizer.batch_summarize(papers)
+
+            console.print(f"\n[bold]Found {len(papers)} papers for '[cyan]{query}[/cyan]':[/bold]\n")
+            _print_papers(papers)
+        finally:
+            await fetcher.close()
 
     asyncio.run(_run())
 
@@ -0,0 +1,74 @@
+"""Loading config.yaml, shared by the web app and the CLI."""
+import functools
+import json
+import logging
+import os
+
+import yaml
+
+try:
+    import orjson  # optional: pip install arxivscribe[fast]
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when available; same safe semantics as yaml.safe_load
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml(stream) -> dict:
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+def load_config(path: str = "config.yaml", json_cache: bool = False) -> dict:
+    """Parse `path`, memoized per (path, mtime).
+
+    With `json_cache`, a parsed copy is kept in ``<path>.json`` and preferred
+    while it is at least as new as the YAML.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Config not found: {path}")
+    # mtime is part of the key so an edited file is parsed again
+    return _load_config(path, os.path.getmtime(path), json_cache)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float, json_cache: bool) -> dict:
+    cache = path + ".json" if json_cache else None
+    if cache and os.path.exists(cache) and os.path.getmtime(cache) >= mtime:
+        try:
+            with open(cache, 'rb') as f:
+                return _json_loads(f.read())
+        except ValueError:
+            logger.warning(f"Ignoring unreadable config cache {cache}")
+    with open(path) as f:
+        config = parse_yaml(f)
+    if cache:
+        _write_cache(cache, config)
+    return config
+
+
+def _write_cache(cache: str, config) -> None:
+    try:
+        data = _json_dumps(config)
+    except TypeError as e:
+        logger.debug(f"Config cache not written: {e}")
+        return
+    # JSON stringifies int keys and dates; only cache what reads back identically
+    if _json_loads(data) != config:
+        logger.debug("Config cache not written: config does not round-trip through JSON")
+        return
+    try:
+        with open(cache, 'wb') as f:
+            f.write(data)
+    except OSError as e:
+        logger.debug(f"Config cache not written: {e}")
@@ -0,0 +1,40 @@
+"""Process environment settings, read once at startup."""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """Snapshot of the environment variables ArxivScribe uses.
+
+    Built once after ``load_dotenv()`` so startup code reads attributes instead
+    of calling ``os.getenv`` repeatedly. Provider keys are picked up from every
+    ``<PROVIDER>_API_KEY`` variable.
+    """
+    smtp_user: str = ''
+    smtp_pass: str = ''
+    config_cache: bool = False
+    api_keys: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_environ(cls) -> "Env":
+        environ = os.environ
+        return cls(
+            smtp_user=environ.get("SMTP_USER", ""),
+            smtp_pass=environ.get("SMTP_PASS", ""),
+            config_cache=environ.get("ARXIVSCRIBE_CONFIG_CACHE", "").lower() in {"1", "true", "yes"},
+            api_keys={
+                name[:-len("_API_KEY")].lower(): value
+                for name, value in environ.items()
+                if name.endswith("_API_KEY") and value
+            },
+        )
+
+    @property
+    def smtp_configured(self) -> bool:
+        return bool(self.smtp_user and self.smtp_pass)
+
+    def api_key(self, provider: str) -> Optional[str]:
+        """Key for `provider`, falling back to the OpenAI key."""
+        return self.api_keys.get(provider.lower()) or self.api_keys.get("openai")
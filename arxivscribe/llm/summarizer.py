@@ -1,5 +1,6 @@
 """LLM-based paper summarizer with concurrent processing."""
 import asyncio
+import hashlib
 import logging
 from typing import Optional, List
 
@@ -20,10 +21,13 @@ class Summarizer:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         max_concurrent: int = 5,
+        cache=None,
         **kwargs
     ):
         self.provider_name = provider.lower()
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Optional DatabaseManager; finished summaries are stored in its llm_cache
+        self.cache = cache
 
         if self.provider_name == "openai":
             self.provider = OpenAIProvider(
@@ -55,15 +59,48 @@ class Summarizer:
         if not title or not abstract:
             return "Summary unavailable — missing title or abstract."
 
+        key = self._cache_key(title, abstract) if self.cache is not None else None
+        if key is not None:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                return cached
+
         try:
             async with self._semaphore:
                 prompt = SUMMARY_PROMPT.format(title=title, abstract=abstract)
-                summary = await self.provider.generate(prompt)
-                return self._clean_summary(summary)
+                raw = await self.provider.generate(prompt)
         except Exception as e:
             logger.error(f"Summary failed for {paper.get('id', '?')}: {e}")
             return "Summary generation failed."
 
+        summary = self._clean_summary(raw)
+        # Empty output becomes a placeholder; don't pin that in the cache
+        if key is not None and raw and raw.strip():
+            await self._cache_put(key, summary)
+        return summary
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            return await self.cache.get_cached_summary(key)
+        except Exception as e:
+            logger.warning(f"Summary cache lookup failed: {e}")
+            return None
+
+    async def _cache_put(self, key: str, summary: str):
+        try:
+            await self.cache.cache_summary(key, self._model_id, summary)
+        except Exception as e:
+            logger.warning(f"Summary cache write failed: {e}")
+
+    @property
+    def _model_id(self) -> str:
+        return f"{self.provider_name}:{self.provider.model}"
+
+    def _cache_key(self, title: str, abstract: str) -> str:
+        # The prompt template is hashed too, so editing it invalidates old entries
+        data = "\x00".join((self._model_id, SUMMARY_PROMPT, title, abstract))
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
     async def extract_keywords(self, paper: dict) -> List[str]:
         """Extract keywords from a paper using LLM."""
         title = paper.get('title', '')
@@ -1,13 +1,76 @@
 """TF-IDF based paper similarity for 'more like this' recommendations."""
 import math
 import re
-from typing import List, Dict, Tuple
+from array import array
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
 
+from arxivscribe.similarity_kernels import accumulate_dots
+
+
+def _paper_text(paper: dict) -> str:
+    """Text used for similarity: title + abstract."""
+    return f"{paper.get('title', '')} {paper.get('abstract', '')}"
+
+
+class _CorpusCache:
+    """Fitted TF-IDF corpus, reused until the papers table changes.
+
+    Stored column-wise (CSC): the postings of term id ``t`` are
+    ``docs[offsets[t]:offsets[t + 1]]`` with float32 weights in ``vals``, so a
+    posting costs 8 bytes instead of a dict entry and a query only walks the
+    postings of its own terms.
+    """
+
+    def __init__(self, papers: List[dict], version, tokens: Optional[List[Optional[List[str]]]] = None):
+        self.version = version
+        self.papers = papers
+        self.vocab: Dict[str, int] = {}
+        if tokens is None:
+            tokens = [None] * len(papers)
+
+        doc_tfs = []
+        df = array('i')
+        for paper, doc in zip(papers, tokens):
+            if doc is None:
+                doc = PaperSimilarity.tokenize(_paper_text(paper))
+            tf = Counter(doc)
+            doc_tfs.append((tf, len(doc) or 1))
+            for term in tf:
+                term_id = self.vocab.setdefault(term, len(self.vocab))
+                if term_id == len(df):
+                    df.append(0)
+                df[term_id] += 1
+
+        n = len(papers)
+        self.idf = array('d', (math.log(n / (1 + freq)) for freq in df))
+        post_docs = [array('i') for _ in df]
+        post_vals = [array('f') for _ in df]
+
+        sq_norms = array('d', bytes(8 * n))
+        for doc_id, (tf, total) in enumerate(doc_tfs):
+            for term, count in tf.items():
+                term_id = self.vocab[term]
+                weight = (count / total) * self.idf[term_id]
+                post_docs[term_id].append(doc_id)
+                post_vals[term_id].append(weight)
+                sq_norms[doc_id] += weight ** 2
+        self.norms = array('d', map(math.sqrt, sq_norms))
+
+        self.offsets = array('i', [0])
+        self.docs = array('i')
+        self.vals = array('f')
+        for term_docs, term_vals in zip(post_docs, post_vals):
+            self.docs.extend(term_docs)
+            self.vals.extend(term_vals)
+            self.offsets.append(len(self.docs))
+
 
 class PaperSimilarity:
     """Lightweight TF-IDF similarity — no external deps needed."""
 
+    _cache: Optional[_CorpusCache] = None
+
     @staticmethod
     def tokenize(text: str) -> List[str]:
         """Simple tokenization: lowercase, alphanum only, remove stopwords."""
@@ -73,12 +136,8 @@ class PaperSimilarity:
         if not all_papers:
             return []
 
-        # Build text from title + abstract
-        def paper_text(p):
-            return f"{p.get('title', '')} {p.get('abstract', '')}"
-
-        target_tokens = cls.tokenize(paper_text(target_paper))
-        all_tokens = [cls.tokenize(paper_text(p)) for p in all_papers]
+        target_tokens = cls.tokenize(_paper_text(target_paper))
+        all_tokens = [cls.tokenize(_paper_text(p)) for p in all_papers]
 
         # Include target in corpus for proper IDF
         all_docs = [target_tokens] + all_tokens
@@ -96,3 +155,53 @@ class PaperSimilarity:
 
         similarities.sort(key=lambda x: x[1], reverse=True)
         return similarities[:top_k]
+
+    @classmethod
+    def corpus_version(cls):
+        """Version of the cached corpus, or None if nothing is fitted yet."""
+        return cls._cache.version if cls._cache else None
+
+    @classmethod
+    def fit_corpus(
+        cls, all_papers: List[dict], version, tokens: Optional[List[Optional[List[str]]]] = None
+    ) -> None:
+        """Vectorize the corpus once; reused by find_similar_cached.
+
+        ``tokens`` optionally supplies pre-tokenized documents (parallel to
+        ``all_papers``); papers whose entry is None are tokenized here.
+        """
+        cls._cache = _CorpusCache(all_papers, version, tokens)
+
+    @classmethod
+    def find_similar_cached(cls, target_paper: dict, top_k: int = 5) -> List[Tuple[dict, float]]:
+        """Like find_similar, but only vectorizes the target against the fitted corpus."""
+        cache = cls._cache
+        if cache is None or not cache.papers:
+            return []
+
+        tf = Counter(cls.tokenize(_paper_text(target_paper)))
+        total = sum(tf.values()) or 1
+        t_idx, t_val = array('i'), array('d')
+        for term, count in tf.items():
+            term_id = cache.vocab.get(term)
+            if term_id is not None:
+                t_idx.append(term_id)
+                t_val.append((count / total) * cache.idf[term_id])
+        target_norm = math.sqrt(sum(v ** 2 for v in t_val))
+        if target_norm == 0:
+            return []
+
+        dots = array('d', bytes(8 * len(cache.papers)))
+        accumulate_dots(t_idx, t_val, cache.offsets, cache.docs, cache.vals, dots)
+
+        similarities = []
+        target_id = target_paper.get('id')
+        for paper, dot, norm in zip(cache.papers, dots, cache.norms):
+            if dot == 0 or norm == 0 or paper.get('id') == target_id:
+                continue
+            sim = dot / (target_norm * norm)
+            if sim > 0.01:
+                similarities.append((paper, sim))
+
+        similarities.sort(key=lambda x: x[1], reverse=True)
+        return similarities[:top_k]
@@ -0,0 +1,46 @@
+"""Inner loops for TF-IDF similarity.
+
+Pure Python by default. When numba is installed (``pip install arxivscribe[fast]``)
+the kernels are JIT-compiled and run on zero-copy numpy views of the arrays.
+"""
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional accelerator
+    np = None
+    njit = None
+
+
+def _accumulate_dots_py(t_idx, t_val, offsets, docs, vals, out):
+    """out[d] += t_val[k] * vals[j] for every posting j of every target term t_idx[k]."""
+    for term, weight in zip(t_idx, t_val):
+        start, end = offsets[term], offsets[term + 1]
+        for doc_id, value in zip(docs[start:end], vals[start:end]):
+            out[doc_id] += weight * value
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _accumulate_dots_jit(t_idx, t_val, offsets, docs, vals, out):
+        for k in range(t_idx.size):
+            term = t_idx[k]
+            weight = t_val[k]
+            for j in range(offsets[term], offsets[term + 1]):
+                out[docs[j]] += weight * vals[j]
+
+
+def accumulate_dots(t_idx, t_val, offsets, docs, vals, out):
+    """Sparse matrix-vector product over CSC postings, accumulated into ``out``.
+
+    All arguments are ``array.array`` buffers: target term ids ('i') and weights
+    ('d'), per-term posting offsets ('i'), posting doc ids ('i') and weights ('f'),
+    and one output slot per document ('d').
+    """
+    if njit is None:
+        _accumulate_dots_py(t_idx, t_val, offsets, docs, vals, out)
+        return
+    _accumulate_dots_jit(
+        np.frombuffer(t_idx, dtype=np.int32), np.frombuffer(t_val, dtype=np.float64),
+        np.frombuffer(offsets, dtype=np.int32), np.frombuffer(docs, dtype=np.int32),
+        np.frombuffer(vals, dtype=np.float32), np.frombuffer(out, dtype=np.float64),
+    )
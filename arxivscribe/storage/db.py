@@ -1,27 +1,274 @@
 """SQLite database manager for ArxivScribe — async via aiosqlite."""
 import aiosqlite
+import asyncio
+import itertools
+import json
 import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+
+from arxivscribe.similarity import PaperSimilarity
+from arxivscribe.storage.models import Paper
 
 logger = logging.getLogger(__name__)
 
+_INSERT_PAPER_SQL = """
+    INSERT OR IGNORE INTO papers
+    (id, title, abstract, authors, published, categories, primary_category, url, pdf_url, summary, matched_keywords)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_TOKENS_SQL = "INSERT OR IGNORE INTO paper_tokens (id, tokens) VALUES (?, ?)"
+_INSERT_CATEGORY_SQL = "INSERT OR IGNORE INTO paper_categories (paper_id, category) VALUES (?, ?)"
+
+# Columns hydrated into Paper, in field order
+_PAPER_COLS = (
+    "id, title, abstract, authors, published, categories, primary_category, "
+    "url, pdf_url, summary, matched_keywords, score, fetched_at"
+)
+_PAPER_COLS_P = ", ".join(f"p.{c.strip()}" for c in _PAPER_COLS.split(","))
+
+_IS_PAPER_STORED_SQL = "SELECT 1 FROM papers WHERE id = ?"
+_CHANNEL_SUBSCRIPTIONS_SQL = "SELECT keyword FROM subscriptions WHERE guild_id = ? AND channel_id = ?"
+_VOTE_PAPER_SQL = "UPDATE papers SET score = score + ? WHERE id = ? RETURNING score"
+_PAPER_SCORE_SQL = "SELECT score FROM papers WHERE id = ?"
+_PAPER_BY_ID_SQL = f"SELECT {_PAPER_COLS} FROM papers WHERE id = ?"
+_EPOCH_NOW_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+_INSERT_POSTED_SQL = f"""
+    INSERT INTO posted_papers (paper_id, guild_id, channel_id, message_id, posted_at)
+    VALUES (?, ?, ?, ?, {_EPOCH_NOW_SQL})
+    ON CONFLICT(paper_id, guild_id, channel_id)
+    DO UPDATE SET message_id = excluded.message_id, posted_at = excluded.posted_at
+"""
+_PAPER_BY_MESSAGE_SQL = (
+    "SELECT paper_id FROM posted_papers WHERE guild_id = ? AND channel_id = ? AND message_id = ?"
+)
+_IS_PAPER_POSTED_SQL = "SELECT 1 FROM posted_papers WHERE paper_id = ? AND guild_id = ? AND channel_id = ?"
+_ADD_VOTE_SQL = """
+    INSERT INTO votes (paper_id, user_id, guild_id, channel_id, vote_type) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(paper_id, user_id, guild_id, channel_id)
+    DO UPDATE SET vote_type = excluded.vote_type, voted_at = CURRENT_TIMESTAMP
+"""
+_VOTE_SUMMARY_SQL = "SELECT upvotes, downvotes, maybe FROM papers WHERE id = ?"
+_LLM_CACHE_GET_SQL = "SELECT summary FROM llm_cache WHERE hash = ?"
+_LLM_CACHE_PUT_SQL = f"""
+    INSERT OR IGNORE INTO llm_cache (hash, model, summary, created_at) VALUES (?, ?, ?, {_EPOCH_NOW_SQL})
+"""
+
+# Size of sqlite3's per-connection compiled statement cache (default 128)
+CACHED_STATEMENTS = 256
+
+# Known-stored paper ids kept in memory for is_paper_stored (LRU beyond this)
+SEEN_PAPERS_MAX = 100_000
+
+# Bumped whenever initialize() gains a migration step (PRAGMA user_version)
+SCHEMA_VERSION = 4
+
+# Vote counter columns the original (unversioned) papers table lacks
+_PAPERS_ADDED_COLUMNS = {
+    'upvotes': "INTEGER DEFAULT 0",
+    'downvotes': "INTEGER DEFAULT 0",
+    'maybe': "INTEGER DEFAULT 0",
+}
+
+# Max bound parameters per IN (...) list; stays under older SQLite builds' 999 cap
+IN_CLAUSE_CHUNK = 900
+
+# Seconds an in-process cached last-fetch time / guild settings row stays fresh
+LAST_FETCH_TTL = 30
+GUILD_SETTINGS_TTL = 60
+GUILD_SETTINGS_MAX = 1024
+DASHBOARD_TTL = 30  # global stats, distinct categories, bookmark collections
+
+# Seconds between background PRAGMA optimize + WAL truncation passes
+MAINTENANCE_INTERVAL = 600
+
+# Read-only connections used round-robin by SELECT-only methods
+READER_POOL_SIZE = 2
+
+
+def _decode_list(value: Optional[str]) -> List[str]:
+    """Decode a JSON array column; rows written before JSON storage hold CSV."""
+    if not value:
+        return []
+    if value[0] == '[':
+        return json.loads(value)
+    return value.split(',')
+
+
+def _encode_list(values) -> str:
+    """Encode a list column as JSON; empty and missing lists skip the encoder."""
+    if not values:
+        return '[]'
+    return json.dumps(values, ensure_ascii=False)
+
+
+def _row_from_paper(paper: dict) -> tuple:
+    """Parameters for _INSERT_PAPER_SQL, in column order."""
+    get = paper.get
+    return (
+        paper['id'], paper['title'], get('abstract', ''),
+        _encode_list(get('authors')), get('published', ''),
+        _encode_list(get('categories')), get('primary_category', ''),
+        get('url', ''), get('pdf_url', ''),
+        get('summary', ''), get('matched_keywords', '')
+    )
+
+
+def _fts_query(keyword: str) -> str:
+    """Quote user input as a single FTS5 phrase with prefix matching."""
+    return '"' + keyword.replace('"', '""') + '"*'
+
+
+# WHERE fragments for (keyword, date_from, date_to, category), in that order
+_PAPER_FILTERS = (
+    "rowid IN (SELECT rowid FROM papers_fts WHERE papers_fts MATCH ?)",
+    "published >= ?",
+    "published <= ?",
+    "EXISTS (SELECT 1 FROM paper_categories pc WHERE pc.paper_id = papers.id AND pc.category = ?)",
+)
+_SORT_SQL = {"date": "fetched_at DESC", "votes": "score DESC", "title": "title ASC"}
+
+# Assembled listing SQL keyed by (kind, which filters are set, sort); a few dozen shapes at most
+_QUERY_CACHE: Dict[tuple, str] = {}
+
+
+def _filter_params(
+    keyword: Optional[str], date_from: Optional[str], date_to: Optional[str], category: Optional[str]
+) -> Tuple[Tuple[bool, ...], list]:
+    """Filter shape plus the bound parameters for the filters that are set."""
+    shape = (bool(keyword), bool(date_from), bool(date_to), bool(category))
+    params = []
+    if keyword:
+        params.append(_fts_query(keyword))
+    if date_from:
+        params.append(date_from)
+    if date_to:
+        params.append(date_to + "T23:59:59")
+    if category:
+        params.append(category)
+    return shape, params
+
+
+_SELECT_SQL = {
+    'select': f"SELECT {_PAPER_COLS} FROM papers",
+    'page': f"SELECT {_PAPER_COLS}, COUNT(*) OVER () FROM papers",
+    'count': "SELECT COUNT(*) FROM papers",
+}
+
+
+def _papers_sql(kind: str, shape: Tuple[bool, ...], sort: Optional[str] = None) -> str:
+    """Listing ('select'), listing-with-total ('page') or 'count' SQL for a filter shape, built once per shape."""
+    order = _SORT_SQL.get(sort, _SORT_SQL["date"]) if kind != 'count' else None
+    key = (kind, shape, order)
+    query = _QUERY_CACHE.get(key)
+    if query is None:
+        conditions = [sql for sql, on in zip(_PAPER_FILTERS, shape) if on]
+        query = _SELECT_SQL[kind]
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if order:
+            query += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        query = _QUERY_CACHE.setdefault(key, query)
+    return query
+
 
 class DatabaseManager:
     """Async SQLite database for subscriptions, papers, and votes."""
 
     def __init__(self, db_path: str = "arxivscribe.db"):
         self.db_path = db_path
-        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn: Optional[aiosqlite.Connection] = None  # the single writer
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_cycle: Optional[Iterator[aiosqlite.Connection]] = None
+        self._reader_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._last_fetch_cache: Optional[Tuple[datetime, float]] = None
+        self._guild_settings_cache: "OrderedDict[int, Tuple[List[str], float]]" = OrderedDict()
+        self._dashboard_cache: Dict[str, Tuple[object, float]] = {}
+        self._maint_task: Optional[asyncio.Task] = None
+        self._seen_papers: "OrderedDict[str, None]" = OrderedDict()
 
     async def _get_conn(self) -> aiosqlite.Connection:
         if self._conn is None:
-            self._conn = await aiosqlite.connect(self.db_path)
+            # Autocommit at the driver level; multi-statement writes go through _txn()
+            self._conn = await aiosqlite.connect(
+                self.db_path, cached_statements=CACHED_STATEMENTS, isolation_level=None
+            )
             self._conn.row_factory = aiosqlite.Row
+            await self._configure(self._conn)
         return self._conn
 
+    @asynccontextmanager
+    async def _txn(self) -> AsyncIterator[aiosqlite.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT on the writer, rolled back on error.
+
+        The writer connection is shared by every coroutine, so transactions are
+        serialized with a lock; all writes must go through here.
+        """
+        conn = await self._get_conn()
+        async with self._write_lock:
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+
+    async def _reader(self) -> aiosqlite.Connection:
+        """A query_only connection, so reads never queue behind the writer's thread under WAL."""
+        if self.db_path == ':memory:':
+            return await self._get_conn()
+        if self._reader_cycle is None:
+            async with self._reader_lock:
+                if self._reader_cycle is None:
+                    await self._get_conn()  # the writer switches the file to WAL first
+                    readers = []
+                    for _ in range(READER_POOL_SIZE):
+                        conn = await aiosqlite.connect(self.db_path, cached_statements=CACHED_STATEMENTS)
+                        conn.row_factory = aiosqlite.Row
+                        await self._configure(conn)
+                        await conn.execute("PRAGMA query_only=1")
+                        readers.append(conn)
+                    self._readers = readers
+                    self._reader_cycle = itertools.cycle(readers)
+        return next(self._reader_cycle)
+
+    def _dashboard_get(self, key: str):
+        cached = self._dashboard_cache.get(key)
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        return None
+
+    def _dashboard_put(self, key: str, value):
+        self._dashboard_cache[key] = (value, time.monotonic() + DASHBOARD_TTL)
+
+    def _invalidate(self, *keys: str):
+        for key in keys:
+            self._dashboard_cache.pop(key, None)
+
+    async def _configure(self, conn: aiosqlite.Connection):
+        """Per-connection PRAGMAs: WAL with relaxed sync, a 64 MiB page cache and enforced foreign keys."""
+        cursor = await conn.execute("PRAGMA journal_mode=WAL")
+        mode = (await cursor.fetchone())[0]
+        if mode.lower() != 'wal' and self.db_path != ':memory:':
+            logger.warning(f"Could not enable WAL (journal_mode={mode}); is the DB on a network filesystem?")
+        await conn.executescript("""
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA busy_timeout=5000;
+            PRAGMA wal_autocheckpoint=1000;
+            PRAGMA foreign_keys=ON;
+        """)
+
     async def initialize(self):
         conn = await self._get_conn()
+        await self._migrate(conn)
         await conn.executescript("""
             CREATE TABLE IF NOT EXISTS subscriptions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -45,7 +292,10 @@ class DatabaseManager:
                 summary TEXT,
                 matched_keywords TEXT,
                 score INTEGER DEFAULT 0,
-                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                upvotes INTEGER DEFAULT 0,
+                downvotes INTEGER DEFAULT 0,
+                maybe INTEGER DEFAULT 0
             );
 
             CREATE TABLE IF NOT EXISTS metadata (
@@ -77,278 +327,684 @@ class DatabaseManager:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
 
+            CREATE TABLE IF NOT EXISTS posted_papers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                paper_id TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                message_id INTEGER,
+                posted_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                FOREIGN KEY (paper_id) REFERENCES papers(id),
+                UNIQUE(paper_id, guild_id, channel_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS votes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                paper_id TEXT NOT NULL,
+                user_id INTEGER NOT NULL,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                vote_type TEXT NOT NULL CHECK(vote_type IN ('upvote', 'downvote', 'maybe')),
+                voted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (paper_id) REFERENCES papers(id),
+                UNIQUE(paper_id, user_id, guild_id, channel_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS guild_settings (
+                guild_id INTEGER PRIMARY KEY,
+                categories TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                hash TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at INTEGER NOT NULL
+            ) WITHOUT ROWID;
+
             CREATE INDEX IF NOT EXISTS idx_papers_fetched ON papers(fetched_at DESC);
             CREATE INDEX IF NOT EXISTS idx_papers_score ON papers(score DESC);
             CREATE INDEX IF NOT EXISTS idx_subscriptions_kw ON subscriptions(keyword);
             CREATE INDEX IF NOT EXISTS idx_bookmarks_paper ON bookmarks(paper_id);
-            CREATE INDEX IF NOT EXISTS idx_bookmarks_collection ON bookmarks(collection);
+            CREATE INDEX IF NOT EXISTS idx_papers_published ON papers(published);
+            DROP INDEX IF EXISTS idx_bookmarks_collection;
+            CREATE INDEX IF NOT EXISTS idx_bookmarks_collection_time ON bookmarks(collection, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_posted_channel_time ON posted_papers(guild_id, channel_id, posted_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_posted_msg ON posted_papers(guild_id, channel_id, message_id);
+            CREATE INDEX IF NOT EXISTS idx_votes_paper_type ON votes(paper_id, vote_type);
+            CREATE INDEX IF NOT EXISTS idx_votes_channel_paper ON votes(guild_id, channel_id, paper_id, vote_type);
         """)
-        await conn.commit()
+
+        # Running totals for get_global_stats, maintained by triggers instead of scans
+        await conn.executescript("""
+            INSERT OR IGNORE INTO metadata (key, value) VALUES
+                ('total_papers', (SELECT COUNT(*) FROM papers)),
+                ('total_abs_score', (SELECT COALESCE(SUM(ABS(score)), 0) FROM papers)),
+                ('distinct_keyword_count', (SELECT COUNT(DISTINCT keyword) FROM subscriptions));
+
+            CREATE TRIGGER IF NOT EXISTS papers_stats_ai AFTER INSERT ON papers BEGIN
+                UPDATE metadata SET value = CAST(value AS INTEGER) + 1 WHERE key = 'total_papers';
+                UPDATE metadata SET value = CAST(value AS INTEGER) + ABS(COALESCE(new.score, 0))
+                WHERE key = 'total_abs_score';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS papers_stats_ad AFTER DELETE ON papers BEGIN
+                UPDATE metadata SET value = CAST(value AS INTEGER) - 1 WHERE key = 'total_papers';
+                UPDATE metadata SET value = CAST(value AS INTEGER) - ABS(COALESCE(old.score, 0))
+                WHERE key = 'total_abs_score';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS papers_stats_au AFTER UPDATE OF score ON papers BEGIN
+                UPDATE metadata
+                SET value = CAST(value AS INTEGER) + ABS(COALESCE(new.score, 0)) - ABS(COALESCE(old.score, 0))
+                WHERE key = 'total_abs_score';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS votes_counts_ai AFTER INSERT ON votes BEGIN
+                UPDATE papers SET upvotes = upvotes + (new.vote_type = 'upvote'),
+                                  downvotes = downvotes + (new.vote_type = 'downvote'),
+                                  maybe = maybe + (new.vote_type = 'maybe')
+                WHERE id = new.paper_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS votes_counts_ad AFTER DELETE ON votes BEGIN
+                UPDATE papers SET upvotes = upvotes - (old.vote_type = 'upvote'),
+                                  downvotes = downvotes - (old.vote_type = 'downvote'),
+                                  maybe = maybe - (old.vote_type = 'maybe')
+                WHERE id = old.paper_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS votes_counts_au AFTER UPDATE OF vote_type ON votes BEGIN
+                UPDATE papers SET upvotes = upvotes - (old.vote_type = 'upvote') + (new.vote_type = 'upvote'),
+                                  downvotes = downvotes - (old.vote_type = 'downvote') + (new.vote_type = 'downvote'),
+                                  maybe = maybe - (old.vote_type = 'maybe') + (new.vote_type = 'maybe')
+                WHERE id = new.paper_id;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS subscriptions_stats_ai AFTER INSERT ON subscriptions
+            WHEN (SELECT COUNT(*) FROM subscriptions WHERE keyword = new.keyword) = 1 BEGIN
+                UPDATE metadata SET value = CAST(value AS INTEGER) + 1 WHERE key = 'distinct_keyword_count';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS subscriptions_stats_ad AFTER DELETE ON subscriptions
+            WHEN NOT EXISTS (SELECT 1 FROM subscriptions WHERE keyword = old.keyword) BEGIN
+                UPDATE metadata SET value = CAST(value AS INTEGER) - 1 WHERE key = 'distinct_keyword_count';
+            END;
+        """)
+
+        # Full-text index over the keyword-searchable columns, kept in sync by triggers
+        cursor = await conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers_fts'")
+        fts_exists = await cursor.fetchone() is not None
+        await conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                title, abstract, authors, matched_keywords,
+                content='papers', content_rowid='rowid', tokenize='porter unicode61'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ai AFTER INSERT ON papers BEGIN
+                INSERT INTO papers_fts(rowid, title, abstract, authors, matched_keywords)
+                VALUES (new.rowid, new.title, new.abstract, new.authors, new.matched_keywords);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS papers_fts_ad AFTER DELETE ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract, authors, matched_keywords)
+                VALUES ('delete', old.rowid, old.title, old.abstract, old.authors, old.matched_keywords);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS papers_fts_au
+            AFTER UPDATE OF title, abstract, authors, matched_keywords ON papers BEGIN
+                INSERT INTO papers_fts(papers_fts, rowid, title, abstract, authors, matched_keywords)
+                VALUES ('delete', old.rowid, old.title, old.abstract, old.authors, old.matched_keywords);
+                INSERT INTO papers_fts(rowid, title, abstract, authors, matched_keywords)
+                VALUES (new.rowid, new.title, new.abstract, new.authors, new.matched_keywords);
+            END;
+        """)
+        if not fts_exists:
+            await conn.execute("INSERT INTO papers_fts(papers_fts) VALUES ('rebuild')")
+
+        # Pre-tokenized title+abstract for similarity, so the corpus can be
+        # rebuilt after a restart without re-running the tokenizer. Kept out of
+        # `papers` so listing queries don't page through it.
+        await conn.executescript("""
+            CREATE TABLE IF NOT EXISTS paper_tokens (
+                id TEXT PRIMARY KEY,
+                tokens TEXT NOT NULL
+            ) WITHOUT ROWID;
+
+            CREATE TRIGGER IF NOT EXISTS paper_tokens_ad AFTER DELETE ON papers BEGIN
+                DELETE FROM paper_tokens WHERE id = old.id;
+            END;
+        """)
+
+        # One row per (paper, category) so category lookups use an index
+        cursor = await conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'paper_categories'")
+        categories_exist = await cursor.fetchone() is not None
+        await conn.executescript("""
+            CREATE TABLE IF NOT EXISTS paper_categories (
+                paper_id TEXT NOT NULL,
+                category TEXT NOT NULL,
+                PRIMARY KEY (paper_id, category)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS idx_pc_cat_paper ON paper_categories(category, paper_id);
+
+            CREATE TRIGGER IF NOT EXISTS paper_categories_ad AFTER DELETE ON papers BEGIN
+                DELETE FROM paper_categories WHERE paper_id = old.id;
+            END;
+        """)
+        if not categories_exist:
+            async with self._txn() as conn:
+                cursor = await conn.execute("SELECT id, categories FROM papers")
+                await conn.executemany(_INSERT_CATEGORY_SQL, [
+                    (row[0], c.strip()) for row in await cursor.fetchall()
+                    for c in _decode_list(row[1]) if c.strip()
+                ])
+
+        cursor = await conn.execute(
+            "SELECT id FROM papers ORDER BY fetched_at DESC LIMIT ?", (SEEN_PAPERS_MAX,)
+        )
+        for row in reversed(await cursor.fetchall()):
+            self._mark_seen(row[0])
+
+        # Refresh planner statistics so the composite indexes get picked
+        await conn.execute("PRAGMA optimize")
+        if self._maint_task is None:
+            self._maint_task = asyncio.create_task(self._maintenance_loop())
         logger.info("Database initialized")
 
+    async def _migrate(self, conn: aiosqlite.Connection):
+        """Bring a database created before schema versioning (user_version 0) up to SCHEMA_VERSION.
+
+        That schema had no votes or posted_papers tables, so only papers needs
+        changes; every other table and index is created by initialize().
+        """
+        cursor = await conn.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
+        if version >= SCHEMA_VERSION:
+            return
+        async with self._txn() as conn:
+            cursor = await conn.execute("PRAGMA table_info(papers)")
+            existing = {row[1] for row in await cursor.fetchall()}
+            if existing:
+                for column, decl in _PAPERS_ADDED_COLUMNS.items():
+                    if column not in existing:
+                        await conn.execute(f"ALTER TABLE papers ADD COLUMN {column} {decl}")
+                # Authors/categories were stored comma-joined; store JSON arrays so json1 functions apply
+                rows = await conn.execute_fetchall("""
+                    SELECT id, authors, categories FROM papers
+                    WHERE (authors <> '' AND NOT json_valid(authors))
+                       OR (categories <> '' AND NOT json_valid(categories))
+                """)
+                await conn.executemany("UPDATE papers SET authors = ?, categories = ? WHERE id = ?", [
+                    (_encode_list(_decode_list(row[1])), _encode_list(_decode_list(row[2])), row[0])
+                    for row in rows
+                ])
+            await conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     # --- Subscriptions ---
 
     async def add_subscription(self, guild_id: int, channel_id: int, keyword: str) -> bool:
-        conn = await self._get_conn()
-        try:
-            await conn.execute(
-                "INSERT INTO subscriptions (guild_id, channel_id, keyword) VALUES (?, ?, ?)",
+        async with self._txn() as conn:
+            cursor = await conn.execute(
+                "INSERT INTO subscriptions (guild_id, channel_id, keyword) VALUES (?, ?, ?) "
+                "ON CONFLICT DO NOTHING RETURNING id",
                 (guild_id, channel_id, keyword.lower())
             )
-            await conn.commit()
-            return True
-        except aiosqlite.IntegrityError:
-            return False
+            row = await cursor.fetchone()
+        self._invalidate('stats')
+        return row is not None
 
     async def remove_subscription(self, guild_id: int, channel_id: int, keyword: str) -> bool:
-        conn = await self._get_conn()
-        cursor = await conn.execute(
-            "DELETE FROM subscriptions WHERE guild_id = ? AND channel_id = ? AND keyword = ?",
-            (guild_id, channel_id, keyword.lower())
-        )
-        await conn.commit()
+        async with self._txn() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM subscriptions WHERE guild_id = ? AND channel_id = ? AND keyword = ?",
+                (guild_id, channel_id, keyword.lower())
+            )
+        self._invalidate('stats')
         return cursor.rowcount > 0
 
     async def get_channel_subscriptions(self, guild_id: int, channel_id: int) -> List[str]:
-        conn = await self._get_conn()
-        cursor = await conn.execute(
-            "SELECT keyword FROM subscriptions WHERE guild_id = ? AND channel_id = ?",
-            (guild_id, channel_id)
-        )
-        return [row[0] for row in await cursor.fetchall()]
+        conn = await self._reader()
+        rows = await conn.execute_fetchall(_CHANNEL_SUBSCRIPTIONS_SQL, (guild_id, channel_id))
+        return [row[0] for row in rows]
 
     async def get_all_subscriptions(self) -> List[str]:
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT DISTINCT keyword FROM subscriptions ORDER BY keyword")
-        return [row[0] for row in await cursor.fetchall()]
+        conn = await self._reader()
+        rows = await conn.execute_fetchall("SELECT DISTINCT keyword FROM subscriptions ORDER BY keyword")
+        return [row[0] for row in rows]
 
     async def get_all_subscribed_channels(self) -> List[Tuple[int, int]]:
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT DISTINCT guild_id, channel_id FROM subscriptions")
-        return [(row[0], row[1]) for row in await cursor.fetchall()]
+        conn = await self._reader()
+        rows = await conn.execute_fetchall("SELECT DISTINCT guild_id, channel_id FROM subscriptions")
+        return [(row[0], row[1]) for row in rows]
 
     # --- Papers (local web) ---
 
     async def store_paper_local(self, paper: dict):
-        conn = await self._get_conn()
-        await conn.execute("""
-            INSERT OR IGNORE INTO papers
-            (id, title, abstract, authors, published, categories, primary_category, url, pdf_url, summary, matched_keywords)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            paper['id'], paper['title'], paper.get('abstract', ''),
-            ','.join(paper.get('authors', [])), paper.get('published', ''),
-            ','.join(paper.get('categories', [])), paper.get('primary_category', ''),
-            paper.get('url', ''), paper.get('pdf_url', ''),
-            paper.get('summary', ''), paper.get('matched_keywords', '')
-        ))
-        await conn.commit()
-
-    async def is_paper_stored(self, paper_id: str) -> bool:
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT 1 FROM papers WHERE id = ?", (paper_id,))
-        return await cursor.fetchone() is not None
-
-    async def get_recent_papers(
-        self, limit: int = 50, offset: int = 0,
-        keyword: Optional[str] = None, sort: str = "date",
-        date_from: Optional[str] = None, date_to: Optional[str] = None,
-        category: Optional[str] = None
-    ) -> List[dict]:
-        conn = await self._get_conn()
-        conditions = []
-        params = []
+        await self.store_papers_local_batch([paper])
 
-        if keyword:
-            conditions.append("(title LIKE ? OR abstract LIKE ? OR matched_keywords LIKE ?)")
-            kw = f"%{keyword}%"
-            params.extend([kw, kw, kw])
+    async def store_papers_local_batch(self, papers: List[dict]):
+        """Insert many papers with one executemany in a single transaction."""
+        if not papers:
+            return
+        async with self._txn() as conn:
+            await self._insert_papers(conn, papers)
+        self._invalidate('stats', 'categories')
+        for paper in papers:
+            self._mark_seen(paper['id'])
 
-        if date_from:
-            conditions.append("published >= ?")
-            params.append(date_from)
+    async def _insert_papers(self, conn: aiosqlite.Connection, papers: List[dict]):
+        """Insert papers with their similarity tokens and category rows; the caller commits."""
+        await conn.executemany(_INSERT_PAPER_SQL, [_row_from_paper(p) for p in papers])
+        await conn.executemany(_INSERT_TOKENS_SQL, [
+            (p['id'], ' '.join(PaperSimilarity.tokenize(f"{p['title']} {p.get('abstract', '')}")))
+            for p in papers
+        ])
+        await conn.executemany(_INSERT_CATEGORY_SQL, [
+            (p['id'], c) for p in papers for c in p.get('categories', []) if c
+        ])
 
-        if date_to:
-            conditions.append("published <= ?")
-            params.append(date_to + "T23:59:59")
+    async def is_paper_stored(self, paper_id: str) -> bool:
+        # Papers are never deleted, so a known id needs no query. Misses still
+        # go to SQLite: another process (e.g. the CLI) may have stored it.
+        if paper_id in self._seen_papers:
+            self._seen_papers.move_to_end(paper_id)
+            return True
+        conn = await self._reader()
+        cursor = await conn.execute(_IS_PAPER_STORED_SQL, (paper_id,))
+        stored = await cursor.fetchone() is not None
+        if stored:
+            self._mark_seen(paper_id)
+        return stored
 
-        if category:
-            conditions.append("categories LIKE ?")
-            params.append(f"%{category}%")
+    async def get_stored_ids(self, paper_ids: List[str]) -> Set[str]:
+        """The subset of `paper_ids` already stored, in one query per IN_CLAUSE_CHUNK ids."""
+        stored = {pid for pid in paper_ids if pid in self._seen_papers}
+        missing = [pid for pid in dict.fromkeys(paper_ids) if pid not in stored]
+        if missing:
+            conn = await self._reader()
+            for i in range(0, len(missing), IN_CLAUSE_CHUNK):
+                chunk = missing[i:i + IN_CLAUSE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = await conn.execute_fetchall(f"SELECT id FROM papers WHERE id IN ({placeholders})", chunk)
+                stored.update(row[0] for row in rows)
+        for pid in stored:
+            self._mark_seen(pid)
+        return stored
 
-        query = "SELECT * FROM papers"
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+    def _mark_seen(self, paper_id: str):
+        self._seen_papers[paper_id] = None
+        self._seen_papers.move_to_end(paper_id)
+        if len(self._seen_papers) > SEEN_PAPERS_MAX:
+            self._seen_papers.popitem(last=False)
 
-        sort_map = {"date": "fetched_at DESC", "votes": "score DESC", "title": "title ASC"}
-        query += f" ORDER BY {sort_map.get(sort, 'fetched_at DESC')}"
-        query += " LIMIT ? OFFSET ?"
+    def _recent_papers_query(
+        self, limit: int, offset: int, keyword: Optional[str], sort: str,
+        date_from: Optional[str], date_to: Optional[str], category: Optional[str]
+    ) -> Tuple[str, list]:
+        shape, params = _filter_params(keyword, date_from, date_to, category)
         params.extend([limit, offset])
+        return _papers_sql('select', shape, sort), params
 
-        cursor = await conn.execute(query, params)
-        rows = await cursor.fetchall()
+    async def get_recent_papers(
+        self, limit: int = 50, offset: int = 0,
+        keyword: Optional[str] = None, sort: str = "date",
+        date_from: Optional[str] = None, date_to: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> List[Paper]:
+        conn = await self._reader()
+        query, params = self._recent_papers_query(limit, offset, keyword, sort, date_from, date_to, category)
+        rows = await conn.execute_fetchall(query, params)
         return [self._paper_from_row(row) for row in rows]
 
+    async def get_papers_page(
+        self, limit: int = 50, offset: int = 0,
+        keyword: Optional[str] = None, sort: str = "date",
+        date_from: Optional[str] = None, date_to: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> Tuple[List[Paper], int]:
+        """One page of papers plus the total matching count, from a single windowed query."""
+        conn = await self._reader()
+        shape, params = _filter_params(keyword, date_from, date_to, category)
+        rows = await conn.execute_fetchall(_papers_sql('page', shape, sort), params + [limit, offset])
+        if rows:
+            return [self._paper_from_row(row) for row in rows], rows[0][13]
+        # Past the last page there is no row to carry the total
+        total = await self.count_papers(keyword, date_from, date_to, category) if offset else 0
+        return [], total
+
     async def count_papers(
         self, keyword: Optional[str] = None,
         date_from: Optional[str] = None, date_to: Optional[str] = None,
         category: Optional[str] = None
     ) -> int:
-        conn = await self._get_conn()
-        conditions = []
-        params = []
-
-        if keyword:
-            conditions.append("(title LIKE ? OR abstract LIKE ? OR matched_keywords LIKE ?)")
-            kw = f"%{keyword}%"
-            params.extend([kw, kw, kw])
-        if date_from:
-            conditions.append("published >= ?")
-            params.append(date_from)
-        if date_to:
-            conditions.append("published <= ?")
-            params.append(date_to + "T23:59:59")
-        if category:
-            conditions.append("categories LIKE ?")
-            params.append(f"%{category}%")
-
-        query = "SELECT COUNT(*) FROM papers"
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
+        conn = await self._reader()
+        shape, params = _filter_params(keyword, date_from, date_to, category)
+        query = _papers_sql('count', shape)
         cursor = await conn.execute(query, params)
         return (await cursor.fetchone())[0]
 
-    async def vote_paper(self, paper_id: str, delta: int):
-        conn = await self._get_conn()
-        await conn.execute("UPDATE papers SET score = score + ? WHERE id = ?", (delta, paper_id))
-        await conn.commit()
+    async def vote_paper(self, paper_id: str, delta: int) -> int:
+        """Apply a vote and return the paper's new score (0 for unknown papers)."""
+        async with self._txn() as conn:
+            cursor = await conn.execute(_VOTE_PAPER_SQL, (delta, paper_id))
+            row = await cursor.fetchone()
+        self._invalidate('stats')
+        return row[0] if row else 0
 
     async def get_paper_score(self, paper_id: str) -> int:
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT score FROM papers WHERE id = ?", (paper_id,))
+        conn = await self._reader()
+        cursor = await conn.execute(_PAPER_SCORE_SQL, (paper_id,))
         row = await cursor.fetchone()
         return row[0] if row else 0
 
-    def _paper_from_row(self, row) -> dict:
-        return {
-            'id': row[0], 'title': row[1], 'abstract': row[2],
-            'authors': row[3].split(',') if row[3] else [],
-            'published': row[4], 'categories': row[5].split(',') if row[5] else [],
-            'primary_category': row[6], 'url': row[7], 'pdf_url': row[8],
-            'summary': row[9], 'matched_keywords': row[10].split(',') if row[10] else [],
-            'score': row[11], 'fetched_at': row[12]
-        }
+    def _paper_from_row(self, row) -> Paper:
+        """Build a Paper from a row selected with _PAPER_COLS (extra trailing columns are ignored)."""
+        return Paper(
+            id=row[0], title=row[1], abstract=row[2],
+            authors=_decode_list(row[3]),
+            published=row[4], categories=_decode_list(row[5]),
+            primary_category=row[6], url=row[7], pdf_url=row[8],
+            summary=row[9], matched_keywords=row[10].split(',') if row[10] else [],
+            score=row[11], fetched_at=row[12]
+        )
 
     # --- Metadata ---
 
     async def get_last_fetch_time(self) -> Optional[datetime]:
-        conn = await self._get_conn()
+        cached = self._last_fetch_cache
+        if cached and time.monotonic() < cached[1]:
+            return cached[0]
+        conn = await self._reader()
         cursor = await conn.execute("SELECT value FROM metadata WHERE key = 'last_fetch_time'")
         row = await cursor.fetchone()
+        value = None
         if row:
             try:
-                return datetime.fromisoformat(row[0])
+                # Epoch seconds; rows written by older releases hold ISO text
+                value = datetime.utcfromtimestamp(int(row[0])) if row[0].isdigit() else datetime.fromisoformat(row[0])
             except ValueError:
                 pass
-        return datetime.utcnow() - timedelta(days=1)
+        if value is None:
+            value = datetime.utcnow() - timedelta(days=1)
+        self._last_fetch_cache = (value, time.monotonic() + LAST_FETCH_TTL)
+        return value
 
     async def update_last_fetch_time(self):
-        conn = await self._get_conn()
-        await conn.execute("""
-            INSERT OR REPLACE INTO metadata (key, value, updated_at)
-            VALUES ('last_fetch_time', ?, CURRENT_TIMESTAMP)
-        """, (datetime.utcnow().isoformat(),))
-        await conn.commit()
+        epoch = int(time.time())
+        now = datetime.utcfromtimestamp(epoch)
+        async with self._txn() as conn:
+            await conn.execute("""
+                INSERT INTO metadata (key, value, updated_at)
+                VALUES ('last_fetch_time', ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+            """, (str(epoch),))
+        self._invalidate('stats')
+        self._last_fetch_cache = (now, time.monotonic() + LAST_FETCH_TTL)
 
     # --- Stats ---
 
     async def get_global_stats(self) -> dict:
-        conn = await self._get_conn()
-        papers = (await (await conn.execute("SELECT COUNT(*) FROM papers")).fetchone())[0]
-        subs = (await (await conn.execute("SELECT COUNT(DISTINCT keyword) FROM subscriptions")).fetchone())[0]
-        votes = (await (await conn.execute("SELECT COALESCE(SUM(ABS(score)), 0) FROM papers")).fetchone())[0]
+        cached = self._dashboard_get('stats')
+        if cached is not None:
+            return dict(cached)
+        conn = await self._reader()
+        cursor = await conn.execute("""
+            SELECT (SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'total_papers'),
+                   (SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'distinct_keyword_count'),
+                   (SELECT CAST(value AS INTEGER) FROM metadata WHERE key = 'total_abs_score')
+        """)
+        papers, subs, votes = await cursor.fetchone()
         last = await self.get_last_fetch_time()
-        return {
+        stats = {
             'total_papers': papers, 'total_subscriptions': subs,
             'total_votes': votes, 'last_fetch': last.isoformat() if last else None
         }
+        self._dashboard_put('stats', stats)
+        return dict(stats)
+
+    # --- Discord posting & votes ---
+
+    async def store_paper(self, paper: dict, guild_id: int, channel_id: int, message_id: int):
+        """Store a paper and record it as posted to a channel, in one transaction."""
+        async with self._txn() as conn:
+            await self._insert_papers(conn, [paper])
+            await conn.execute(_INSERT_POSTED_SQL, (paper['id'], guild_id, channel_id, message_id))
+        self._invalidate('stats', 'categories')
+        self._mark_seen(paper['id'])
+
+    async def is_paper_posted(self, paper_id: str, guild_id: int, channel_id: int) -> bool:
+        conn = await self._reader()
+        cursor = await conn.execute(_IS_PAPER_POSTED_SQL, (paper_id, guild_id, channel_id))
+        return await cursor.fetchone() is not None
+
+    async def get_paper_by_message(self, guild_id: int, channel_id: int, message_id: int) -> Optional[str]:
+        """Id of the paper posted as `message_id`, for mapping reactions back to papers."""
+        conn = await self._reader()
+        cursor = await conn.execute(_PAPER_BY_MESSAGE_SQL, (guild_id, channel_id, message_id))
+        row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def add_vote(self, paper_id: str, user_id: int, guild_id: int, channel_id: int, vote_type: str):
+        """Record a user's vote; voting again in the same channel replaces it."""
+        async with self._txn() as conn:
+            await conn.execute(_ADD_VOTE_SQL, (paper_id, user_id, guild_id, channel_id, vote_type))
+
+    async def get_vote_summary(self, paper_id: str) -> dict:
+        conn = await self._reader()
+        cursor = await conn.execute(_VOTE_SUMMARY_SQL, (paper_id,))
+        up, down, maybe = await cursor.fetchone() or (0, 0, 0)
+        return {'upvotes': up, 'downvotes': down, 'maybe': maybe}
+
+    async def get_top_papers(self, guild_id: int, channel_id: int, days: int = 7, limit: int = 10) -> List[dict]:
+        """Papers posted to a channel in the last `days` days, by net votes."""
+        conn = await self._reader()
+        since = int(time.time()) - days * 86400
+        rows = await conn.execute_fetchall("""
+            SELECT p.id, p.title, p.url,
+                   SUM(v.vote_type = 'upvote') AS upvotes,
+                   SUM(v.vote_type = 'downvote') AS downvotes
+            FROM posted_papers pp
+            JOIN papers p ON p.id = pp.paper_id
+            JOIN votes v ON v.paper_id = pp.paper_id AND v.guild_id = pp.guild_id AND v.channel_id = pp.channel_id
+            WHERE pp.guild_id = ? AND pp.channel_id = ? AND pp.posted_at >= ?
+            GROUP BY p.id
+            ORDER BY upvotes - downvotes DESC, upvotes DESC
+            LIMIT ?
+        """, (guild_id, channel_id, since, limit))
+        return [
+            {'id': row[0], 'title': row[1], 'url': row[2], 'upvotes': row[3], 'downvotes': row[4]}
+            for row in rows
+        ]
+
+    async def get_stats(self, guild_id: int, channel_id: int) -> dict:
+        """Per-channel counts for the bot's stats command."""
+        conn = await self._reader()
+        cursor = await conn.execute("""
+            SELECT (SELECT COUNT(*) FROM subscriptions WHERE guild_id = ?1 AND channel_id = ?2),
+                   (SELECT COUNT(*) FROM posted_papers WHERE guild_id = ?1 AND channel_id = ?2),
+                   (SELECT COUNT(*) FROM votes WHERE guild_id = ?1 AND channel_id = ?2)
+        """, (guild_id, channel_id))
+        subs, posted, votes = await cursor.fetchone()
+        return {'subscriptions': subs, 'papers_posted': posted, 'total_votes': votes}
+
+    async def get_guild_settings(self, guild_id: int) -> dict:
+        cached = self._guild_settings_cache.get(guild_id)
+        if cached and time.monotonic() < cached[1]:
+            return {'guild_id': guild_id, 'categories': list(cached[0])}
+        conn = await self._reader()
+        cursor = await conn.execute("SELECT categories FROM guild_settings WHERE guild_id = ?", (guild_id,))
+        row = await cursor.fetchone()
+        categories = _decode_list(row[0]) if row else []
+        self._guild_settings_cache[guild_id] = (categories, time.monotonic() + GUILD_SETTINGS_TTL)
+        self._guild_settings_cache.move_to_end(guild_id)
+        if len(self._guild_settings_cache) > GUILD_SETTINGS_MAX:
+            self._guild_settings_cache.popitem(last=False)
+        return {'guild_id': guild_id, 'categories': list(categories)}
+
+    async def set_guild_categories(self, guild_id: int, categories: List[str]):
+        async with self._txn() as conn:
+            await conn.execute("""
+                INSERT INTO guild_settings (guild_id, categories) VALUES (?, ?)
+                ON CONFLICT(guild_id) DO UPDATE SET categories = excluded.categories, updated_at = CURRENT_TIMESTAMP
+            """, (guild_id, _encode_list(categories)))
+        self._guild_settings_cache.pop(guild_id, None)
+
+    async def _maintenance_loop(self):
+        while True:
+            await asyncio.sleep(MAINTENANCE_INTERVAL)
+            try:
+                await self._run_maintenance()
+            except Exception as e:
+                logger.warning(f"Database maintenance failed: {e}")
+
+    async def _run_maintenance(self):
+        """Refresh planner stats and fold the WAL back into the main file."""
+        conn = await self._get_conn()
+        async with self._write_lock:
+            await conn.execute("PRAGMA optimize")
+            await conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
     async def close(self):
+        if self._maint_task:
+            self._maint_task.cancel()
+            try:
+                await self._maint_task
+            except asyncio.CancelledError:
+                pass
+            self._maint_task = None
+        for reader in self._readers:
+            await reader.close()
+        self._readers = []
+        self._reader_cycle = None
         if self._conn:
+            try:
+                await self._run_maintenance()
+            except Exception as e:
+                logger.warning(f"Database maintenance failed: {e}")
             await self._conn.close()
             self._conn = None
 
     # --- Bookmarks ---
 
     async def add_bookmark(self, paper_id: str, collection: str = "Reading List", notes: str = "") -> bool:
-        conn = await self._get_conn()
-        try:
-            await conn.execute(
-                "INSERT INTO bookmarks (paper_id, collection, notes) VALUES (?, ?, ?)",
-                (paper_id, collection, notes)
+        async with self._txn() as conn:
+            # Unknown papers insert nothing instead of tripping the foreign key
+            cursor = await conn.execute(
+                "INSERT INTO bookmarks (paper_id, collection, notes) "
+                "SELECT ?, ?, ? WHERE EXISTS (SELECT 1 FROM papers WHERE id = ?) "
+                "ON CONFLICT DO NOTHING RETURNING id",
+                (paper_id, collection, notes, paper_id)
             )
-            await conn.commit()
-            return True
-        except aiosqlite.IntegrityError:
-            return False
+            row = await cursor.fetchone()
+        self._invalidate('collections')
+        return row is not None
 
     async def remove_bookmark(self, paper_id: str, collection: str = "Reading List") -> bool:
-        conn = await self._get_conn()
-        cursor = await conn.execute(
-            "DELETE FROM bookmarks WHERE paper_id = ? AND collection = ?",
-            (paper_id, collection)
-        )
-        await conn.commit()
+        async with self._txn() as conn:
+            cursor = await conn.execute(
+                "DELETE FROM bookmarks WHERE paper_id = ? AND collection = ?",
+                (paper_id, collection)
+            )
+        self._invalidate('collections')
         return cursor.rowcount > 0
 
     async def get_bookmarks(self, collection: str = None) -> List[dict]:
-        conn = await self._get_conn()
+        conn = await self._reader()
         if collection:
-            cursor = await conn.execute("""
-                SELECT p.*, b.collection, b.notes, b.created_at as bookmarked_at
+            rows = await conn.execute_fetchall(f"""
+                SELECT {_PAPER_COLS_P}, b.collection, b.notes, b.created_at as bookmarked_at
                 FROM bookmarks b JOIN papers p ON b.paper_id = p.id
                 WHERE b.collection = ? ORDER BY b.created_at DESC
             """, (collection,))
         else:
-            cursor = await conn.execute("""
-                SELECT p.*, b.collection, b.notes, b.created_at as bookmarked_at
+            rows = await conn.execute_fetchall(f"""
+                SELECT {_PAPER_COLS_P}, b.collection, b.notes, b.created_at as bookmarked_at
                 FROM bookmarks b JOIN papers p ON b.paper_id = p.id
                 ORDER BY b.created_at DESC
             """)
-        rows = await cursor.fetchall()
         results = []
         for row in rows:
-            paper = self._paper_from_row(row)
-            paper['collection'] = row[13] if len(row) > 13 else 'Reading List'
-            paper['notes'] = row[14] if len(row) > 14 else ''
-            paper['bookmarked_at'] = row[15] if len(row) > 15 else ''
+            paper = self._paper_from_row(row).as_dict()
+            paper['collection'] = row['collection'] or 'Reading List'
+            paper['notes'] = row['notes'] or ''
+            paper['bookmarked_at'] = row['bookmarked_at'] or ''
             results.append(paper)
         return results
 
     async def get_collections(self) -> List[dict]:
-        conn = await self._get_conn()
-        cursor = await conn.execute("""
-            SELECT collection, COUNT(*) as count FROM bookmarks GROUP BY collection ORDER BY collection
-        """)
-        return [{'name': row[0], 'count': row[1]} for row in await cursor.fetchall()]
+        cached = self._dashboard_get('collections')
+        if cached is None:
+            conn = await self._reader()
+            rows = await conn.execute_fetchall("""
+                SELECT collection, COUNT(*) as count FROM bookmarks GROUP BY collection ORDER BY collection
+            """)
+            cached = [(row[0], row[1]) for row in rows]
+            self._dashboard_put('collections', cached)
+        return [{'name': name, 'count': count} for name, count in cached]
 
     async def is_bookmarked(self, paper_id: str) -> bool:
-        conn = await self._get_conn()
+        conn = await self._reader()
         cursor = await conn.execute("SELECT 1 FROM bookmarks WHERE paper_id = ?", (paper_id,))
         return await cursor.fetchone() is not None
 
-    async def get_paper_by_id(self, paper_id: str) -> Optional[dict]:
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT * FROM papers WHERE id = ?", (paper_id,))
+    async def get_paper_by_id(self, paper_id: str) -> Optional[Paper]:
+        conn = await self._reader()
+        cursor = await conn.execute(_PAPER_BY_ID_SQL, (paper_id,))
         row = await cursor.fetchone()
         return self._paper_from_row(row) if row else None
 
-    async def get_all_papers_for_similarity(self) -> List[dict]:
+    async def get_papers_version(self) -> int:
+        """Cheap change marker for the papers table (bumps on every insert)."""
+        conn = await self._reader()
+        cursor = await conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM papers")
+        return (await cursor.fetchone())[0]
+
+    async def get_all_papers_for_similarity(self) -> List[Paper]:
         """Get all papers with title+abstract for similarity computation."""
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT * FROM papers ORDER BY fetched_at DESC LIMIT 500")
-        return [self._paper_from_row(row) for row in await cursor.fetchall()]
+        conn = await self._reader()
+        rows = await conn.execute_fetchall(f"SELECT {_PAPER_COLS} FROM papers ORDER BY fetched_at DESC LIMIT 500")
+        return [self._paper_from_row(row) for row in rows]
+
+    async def get_similarity_corpus(self, limit: int = 500) -> List[Tuple[dict, Optional[List[str]]]]:
+        """Recent papers as light {id, title, abstract} dicts paired with their stored tokens.
+
+        Tokens are None for rows stored before the column existed. Authors and
+        categories are not fetched or decoded; hydrate the few matches with
+        get_papers_by_ids.
+        """
+        conn = await self._reader()
+        rows = await conn.execute_fetchall(
+            "SELECT p.id, p.title, p.abstract, t.tokens FROM papers p "
+            "LEFT JOIN paper_tokens t ON t.id = p.id ORDER BY p.fetched_at DESC LIMIT ?", (limit,)
+        )
+        return [
+            ({'id': row[0], 'title': row[1], 'abstract': row[2]}, row[3].split() if row[3] is not None else None)
+            for row in rows
+        ]
+
+    async def get_papers_by_ids(self, paper_ids: List[str]) -> List[Paper]:
+        """Fetch full papers for the given ids, in the order given (missing ids are skipped)."""
+        if not paper_ids:
+            return []
+        conn = await self._reader()
+        placeholders = ",".join("?" * len(paper_ids))
+        rows = await conn.execute_fetchall(f"SELECT {_PAPER_COLS} FROM papers WHERE id IN ({placeholders})", paper_ids)
+        by_id = {row[0]: self._paper_from_row(row) for row in rows}
+        return [by_id[pid] for pid in paper_ids if pid in by_id]
+
+    # --- LLM result cache ---
+
+    async def get_cached_summary(self, key: str) -> Optional[str]:
+        conn = await self._reader()
+        cursor = await conn.execute(_LLM_CACHE_GET_SQL, (key,))
+        row = await cursor.fetchone()
+        return row[0] if row else None
+
+    async def cache_summary(self, key: str, model: str, summary: str):
+        async with self._txn() as conn:
+            await conn.execute(_LLM_CACHE_PUT_SQL, (key, model, summary))
 
     # --- Digest configs ---
 
@@ -356,21 +1012,21 @@ class DatabaseManager:
         self, digest_type: str, target: str, keywords: str = "",
         categories: str = "", schedule: str = "daily", send_hour: int = 9
     ) -> int:
-        conn = await self._get_conn()
-        cursor = await conn.execute("""
-            INSERT INTO digest_config (type, target, keywords, categories, schedule, send_hour)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (digest_type, target, keywords, categories, schedule, send_hour))
-        await conn.commit()
-        return cursor.lastrowid
+        async with self._txn() as conn:
+            cursor = await conn.execute("""
+                INSERT INTO digest_config (type, target, keywords, categories, schedule, send_hour)
+                VALUES (?, ?, ?, ?, ?, ?)
+                RETURNING id
+            """, (digest_type, target, keywords, categories, schedule, send_hour))
+            row = await cursor.fetchone()
+        return row[0]
 
     async def get_digest_configs(self, enabled_only: bool = True) -> List[dict]:
-        conn = await self._get_conn()
+        conn = await self._reader()
         query = "SELECT * FROM digest_config"
         if enabled_only:
             query += " WHERE enabled = 1"
-        cursor = await conn.execute(query)
-        rows = await cursor.fetchall()
+        rows = await conn.execute_fetchall(query)
         return [{
             'id': r[0], 'type': r[1], 'target': r[2], 'keywords': r[3],
             'categories': r[4], 'schedule': r[5], 'send_hour': r[6],
@@ -378,35 +1034,30 @@ class DatabaseManager:
         } for r in rows]
 
     async def remove_digest_config(self, digest_id: int) -> bool:
-        conn = await self._get_conn()
-        cursor = await conn.execute("DELETE FROM digest_config WHERE id = ?", (digest_id,))
-        await conn.commit()
+        async with self._txn() as conn:
+            cursor = await conn.execute("DELETE FROM digest_config WHERE id = ?", (digest_id,))
         return cursor.rowcount > 0
 
     async def toggle_digest_config(self, digest_id: int, enabled: bool) -> bool:
-        conn = await self._get_conn()
-        cursor = await conn.execute(
-            "UPDATE digest_config SET enabled = ? WHERE id = ?", (int(enabled), digest_id)
-        )
-        await conn.commit()
+        async with self._txn() as conn:
+            cursor = await conn.execute(
+                "UPDATE digest_config SET enabled = ? WHERE id = ?", (int(enabled), digest_id)
+            )
         return cursor.rowcount > 0
 
     async def update_digest_last_sent(self, digest_id: int):
-        conn = await self._get_conn()
-        await conn.execute(
-            "UPDATE digest_config SET last_sent = ? WHERE id = ?",
-            (datetime.utcnow().isoformat(), digest_id)
-        )
-        await conn.commit()
+        async with self._txn() as conn:
+            await conn.execute(
+                "UPDATE digest_config SET last_sent = ? WHERE id = ?",
+                (datetime.utcnow().isoformat(), digest_id)
+            )
 
     async def get_distinct_categories(self) -> List[str]:
         """Get all distinct categories from stored papers."""
-        conn = await self._get_conn()
-        cursor = await conn.execute("SELECT DISTINCT categories FROM papers WHERE categories != '' LIMIT 200")
-        cats = set()
-        for row in await cursor.fetchall():
-            for c in (row[0] or '').split(','):
-                c = c.strip()
-                if c:
-                    cats.add(c)
-        return sorted(cats)
+        cached = self._dashboard_get('categories')
+        if cached is None:
+            conn = await self._reader()
+            rows = await conn.execute_fetchall("SELECT DISTINCT category FROM paper_categories ORDER BY category")
+            cached = [row[0] for row in rows]
+            self._dashboard_put('categories', cached)
+        return list(cached)
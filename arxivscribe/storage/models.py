@@ -0,0 +1,43 @@
+"""Row types returned by the storage layer."""
+from dataclasses import dataclass, field, fields
+from typing import Any, List
+
+
+@dataclass(slots=True)
+class Paper:
+    """A stored paper. Slotted to keep large result sets compact.
+
+    Supports read-only mapping access (``paper['title']``, ``paper.get(...)``)
+    so code written against the old dict rows keeps working.
+    """
+    id: str
+    title: str
+    abstract: str = ''
+    authors: List[str] = field(default_factory=list)
+    published: str = ''
+    categories: List[str] = field(default_factory=list)
+    primary_category: str = ''
+    url: str = ''
+    pdf_url: str = ''
+    summary: str = ''
+    matched_keywords: List[str] = field(default_factory=list)
+    score: int = 0
+    fetched_at: str = ''
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PAPER_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _PAPER_FIELDS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _PAPER_FIELDS else default
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# Keys the mapping shim answers for; methods like as_dict are not row data
+_PAPER_FIELDS = frozenset(f.name for f in fields(Paper))
@@ -2,11 +2,12 @@
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
-from typing import Optional, List
+from typing import Optional, List, Set
 from pathlib import Path
+import asyncio
 import logging
-import os
 
+from arxivscribe.env import Env
 from arxivscribe.storage.db import DatabaseManager
 from arxivscribe.arxiv.fetcher import ArxivFetcher
 from arxivscribe.llm.summarizer import Summarizer
@@ -24,11 +25,15 @@ _fetcher: Optional[ArxivFetcher] = None
 _summarizer: Optional[Summarizer] = None
 _categories: List[str] = []
 _config: dict = {}
+_env: Env = Env()
+_similarity_lock = asyncio.Lock()
+_background_tasks: Set[asyncio.Task] = set()
 
 
-def set_app_deps(db, fetcher, summarizer, categories, config):
-    global _db, _fetcher, _summarizer, _categories, _config
+def set_app_deps(db, fetcher, summarizer, categories, config, env: Optional[Env] = None):
+    global _db, _fetcher, _summarizer, _categories, _config, _env
     _db, _fetcher, _summarizer, _categories, _config = db, fetcher, summarizer, categories, config
+    _env = env or Env.from_environ()
 
 
 # --- Pages ---
@@ -46,7 +51,7 @@ async def index(request: Request):
         "stats": stats, "categories": _categories, "distinct_categories": distinct_cats,
         "has_summarizer": _summarizer is not None,
         "collections": collections, "digests": digests,
-        "smtp_configured": bool(os.getenv("SMTP_USER")),
+        "smtp_configured": bool(_env.smtp_user),
     })
 
 
@@ -92,14 +97,21 @@ async def fetch_papers(summarize: bool = Query(True), use_keywords: bool = Query
     if summarize and _summarizer:
         papers = await _summarizer.batch_summarize(papers)
 
-    stored = 0
+    stored_ids = await _db.get_stored_ids([p['id'] for p in papers])
+    new_papers = []
     for paper in papers:
-        if not await _db.is_paper_stored(paper['id']):
+        if paper['id'] not in stored_ids:
             paper['matched_keywords'] = ','.join(matched_kw_map.get(paper['id'], []))
-            await _db.store_paper_local(paper)
-            stored += 1
+            new_papers.append(paper)
+    await _db.store_papers_local_batch(new_papers)
+    stored = len(new_papers)
 
     await _db.update_last_fetch_time()
+    if stored:
+        # Warm the similarity corpus now rather than on the next /api/similar click
+        task = asyncio.create_task(_refresh_similarity())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     return {"status": "ok", "fetched": len(papers), "new": stored}
 
 
@@ -114,13 +126,10 @@ async def get_papers(
     category: Optional[str] = None,
 ):
     offset = (page - 1) * per_page
-    papers = await _db.get_recent_papers(
+    papers, total = await _db.get_papers_page(
         limit=per_page, offset=offset, keyword=keyword, sort=sort,
         date_from=date_from, date_to=date_to, category=category
     )
-    total = await _db.count_papers(
-        keyword=keyword, date_from=date_from, date_to=date_to, category=category
-    )
     total_pages = max(1, -(-total // per_page))  # ceil division
     return {
         "papers": papers, "total": total,
@@ -143,8 +152,7 @@ async def search_arxiv(q: str = Query(..., min_length=2), count: int = Query(10,
 
 @router.post("/api/vote/{paper_id}")
 async def vote(paper_id: str, vote_type: str = Query(..., pattern="^(up|down)$")):
-    await _db.vote_paper(paper_id, 1 if vote_type == "up" else -1)
-    score = await _db.get_paper_score(paper_id)
+    score = await _db.vote_paper(paper_id, 1 if vote_type == "up" else -1)
     return {"status": "ok", "score": score}
 
 
@@ -176,14 +184,27 @@ async def get_collections():
 
 # --- Similar papers ---
 
+async def _refresh_similarity():
+    """Refit the TF-IDF corpus if papers changed; the fit runs in a worker thread."""
+    async with _similarity_lock:
+        version = await _db.get_papers_version()
+        if PaperSimilarity.corpus_version() != version:
+            corpus = await _db.get_similarity_corpus()
+            await asyncio.to_thread(
+                PaperSimilarity.fit_corpus, [p for p, _ in corpus], version, [t for _, t in corpus]
+            )
+
+
 @router.get("/api/similar/{paper_id}")
 async def similar_papers(paper_id: str, count: int = Query(5, ge=1, le=20)):
     target = await _db.get_paper_by_id(paper_id)
     if not target:
         return {"error": "Paper not found", "papers": []}
-    all_papers = await _db.get_all_papers_for_similarity()
-    similar = PaperSimilarity.find_similar(target, all_papers, top_k=count)
-    return {"papers": [{"paper": p, "score": round(s, 3)} for p, s in similar]}
+    await _refresh_similarity()
+    similar = PaperSimilarity.find_similar_cached(target, top_k=count)
+    scores = {p['id']: s for p, s in similar}
+    papers = await _db.get_papers_by_ids(list(scores))
+    return {"papers": [{"paper": p, "score": round(scores[p.id], 3)} for p in papers]}
 
 
 # --- Export ---
@@ -246,13 +267,11 @@ async def toggle_digest(digest_id: int, enabled: bool = Query(...)):
 @router.post("/api/digests/test")
 async def test_digest(email: str = Query(...)):
     """Send a test digest email."""
-    smtp_user = os.getenv("SMTP_USER", "")
-    smtp_pass = os.getenv("SMTP_PASS", "")
-    if not smtp_user or not smtp_pass:
+    if not _env.smtp_configured:
         return {"status": "error", "message": "SMTP not configured. Set SMTP_USER and SMTP_PASS in .env"}
 
     from arxivscribe.digest import DigestMailer
-    mailer = DigestMailer(smtp_user=smtp_user, smtp_pass=smtp_pass)
+    mailer = DigestMailer(smtp_user=_env.smtp_user, smtp_pass=_env.smtp_pass)
 
     papers = await _db.get_recent_papers(limit=5)
     if not papers:
@@ -1,43 +1,61 @@
 """ArxivScribe — Local web app for arXiv paper digests with AI summaries."""
 import uvicorn
-import yaml
-import os
 import logging
+import logging.handlers
+import queue
+import atexit
 import webbrowser
 from pathlib import Path
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+try:
+    import orjson  # optional: pip install arxivscribe[fast]
+except ImportError:
+    orjson = None
+
+from arxivscribe.config import load_config as _load_config
+from arxivscribe.env import Env
 from arxivscribe.storage.db import DatabaseManager
 from arxivscribe.arxiv.fetcher import ArxivFetcher
 from arxivscribe.llm.summarizer import Summarizer
 from arxivscribe.web.routes import router, set_app_deps
 
 load_dotenv()
+env = Env.from_environ()
+
+# Records are formatted by the QueueHandler and written to the file and console
+# by a listener thread, so logging from request handlers never blocks on disk I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.FileHandler('arxivscribe.log'), logging.StreamHandler()
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler('arxivscribe.log'), logging.StreamHandler()]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 
 def load_config(path: str = "config.yaml") -> dict:
-    if not os.path.exists(path):
-        raise FileNotFoundError(f"Config not found: {path}")
-    with open(path) as f:
-        return yaml.safe_load(f)
+    return _load_config(path, json_cache=env.config_cache)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown."""
-    config = load_config()
+    # main() loads the config before starting uvicorn; `uvicorn main:app` does not
+    config = getattr(app.state, 'config', None) or load_config()
+    app.state.config = config
 
     # DB
     db_path = config.get('storage', {}).get('database_path', 'arxivscribe.db')
@@ -54,12 +72,13 @@ async def lifespan(app: FastAPI):
     # Summarizer
     llm_cfg = config.get('llm', {})
     provider = llm_cfg.get('provider', 'openai')
-    api_key = os.getenv(f"{provider.upper()}_API_KEY") or os.getenv("OPENAI_API_KEY")
+    api_key = env.api_key(provider)
     summarizer = Summarizer(
         provider=provider,
         api_key=api_key,
         model=llm_cfg.get('model'),
-        max_concurrent=llm_cfg.get('max_concurrent', 5)
+        max_concurrent=llm_cfg.get('max_concurrent', 5),
+        cache=db,
     ) if api_key else None
 
     if not summarizer:
@@ -67,15 +86,13 @@ async def lifespan(app: FastAPI):
 
     categories = arxiv_cfg.get('categories', ['cs.LG', 'cs.AI'])
 
-    set_app_deps(db, fetcher, summarizer, categories, config)
+    set_app_deps(db, fetcher, summarizer, categories, config, env)
 
     # Start digest scheduler if SMTP configured
-    smtp_user = os.getenv("SMTP_USER", "")
-    smtp_pass = os.getenv("SMTP_PASS", "")
     digest_scheduler = None
-    if smtp_user and smtp_pass:
+    if env.smtp_configured:
         from arxivscribe.digest import DigestMailer, DigestScheduler
-        mailer = DigestMailer(smtp_user=smtp_user, smtp_pass=smtp_pass)
+        mailer = DigestMailer(smtp_user=env.smtp_user, smtp_pass=env.smtp_pass)
         digest_scheduler = DigestScheduler(db, fetcher, summarizer, mailer, categories)
         digest_scheduler.start()
         logger.info("Digest email scheduler started")
@@ -86,10 +103,15 @@ async def lifespan(app: FastAPI):
 
     if digest_scheduler:
         digest_scheduler.stop()
+    await fetcher.close()
     await db.close()
 
 
-app = FastAPI(title="ArxivScribe", lifespan=lifespan)
+app = FastAPI(
+    title="ArxivScribe",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson else JSONResponse,
+)
 
 # Static files and templates
 static_dir = Path(__file__).parent / "arxivscribe" / "web" / "static"
@@ -100,15 +122,17 @@ app.include_router(router)
 
 
 def main():
-    config = load_config()
+    config = app.state.config = load_config()
     host = config.get('server', {}).get('host', '127.0.0.1')
     port = config.get('server', {}).get('port', 8000)
 
     print(f"\n  ArxivScribe running at http://{host}:{port}\n")
     webbrowser.open(f"http://{host}:{port}")
 
+    # Pass the app object rather than "main:app" so uvicorn doesn't re-import
+    # this file as a second module with its own config cache
     uvicorn.run(
-        "main:app",
+        app,
         host=host,
         port=port,
         reload=False,
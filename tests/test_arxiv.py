@@ -8,9 +8,11 @@ from arxivscribe.arxiv.parser import ArxivParser
 
 
 @pytest.fixture
-def fetcher():
+async def fetcher():
     """Create ArxivFetcher instance."""
-    return ArxivFetcher(max_results_per_category=10)
+    fetcher = ArxivFetcher(max_results_per_category=10)
+    yield fetcher
+    await fetcher.close()
 
 
 @pytest.fixture
@@ -64,3 +66,12 @@ def test_parser(sample_xml):
     assert len(paper['authors']) == 2
     assert 'John Doe' in paper['authors']
     assert 'cs.LG' in paper['categories']
+
+
+@pytest.mark.asyncio
+async def test_fetcher_reuses_session(fetcher):
+    session = await fetcher._get_session()
+    assert await fetcher._get_session() is session
+    await fetcher.close()
+    assert session.closed
+    assert await fetcher._get_session() is not session
@@ -0,0 +1,36 @@
+"""Unit tests for config loading."""
+import os
+
+from arxivscribe.config import load_config
+
+
+def _write(path, text, mtime=None):
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_json_cache_written_and_preferred(tmp_path):
+    path = _write(tmp_path / "config.yaml", "arxiv:\n  categories: [cs.LG]\n", mtime=1_000_000)
+    assert load_config(path, json_cache=True) == {'arxiv': {'categories': ['cs.LG']}}
+    cache = tmp_path / "config.yaml.json"
+    assert cache.exists()
+
+    # A fresh cache is read instead of the YAML
+    _write(cache, '{"from": "cache"}', mtime=1_000_001)
+    os.utime(path, (1_000_000.5, 1_000_000.5))
+    assert load_config(path, json_cache=True) == {'from': 'cache'}
+
+
+def test_json_cache_skipped_when_not_round_trippable(tmp_path):
+    path = _write(tmp_path / "config.yaml", "ports:\n  1: a\nsince: 2024-01-02\n")
+    config = load_config(path, json_cache=True)
+    assert 1 in config['ports']
+    assert not (tmp_path / "config.yaml.json").exists()
+
+
+def test_json_cache_off_by_default(tmp_path):
+    path = _write(tmp_path / "config.yaml", "a: 1\n")
+    assert load_config(path) == {'a': 1}
+    assert not (tmp_path / "config.yaml.json").exists()
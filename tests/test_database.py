@@ -1,4 +1,5 @@
 """Unit tests for database operations."""
+import asyncio
 import pytest
 import os
 from arxivscribe.storage.db import DatabaseManager
@@ -16,6 +17,16 @@ async def db():
         os.remove(db_path)
 
 
+SEED_PAPERS = [{'id': f'2300.0000{i}', 'title': f'Paper {i}'} for i in range(5)]
+
+
+@pytest.fixture
+async def seeded_db(db):
+    """Test database holding SEED_PAPERS."""
+    await db.store_papers_local_batch([dict(p) for p in SEED_PAPERS])
+    return db
+
+
 @pytest.mark.asyncio
 async def test_add_subscription(db):
     result = await db.add_subscription(123, 456, "attention")
@@ -87,3 +98,269 @@ async def test_stats(db):
     stats = await db.get_stats(123, 456)
     assert stats['subscriptions'] == 1
     assert stats['papers_posted'] == 1
+
+
+@pytest.mark.asyncio
+async def test_store_paper_local_concurrently(db):
+    papers = [
+        {'id': f'2301.0000{i}', 'title': f'Paper {i}', 'authors': ['A'], 'categories': ['cs.LG']}
+        for i in range(5)
+    ]
+    await asyncio.gather(*(db.store_paper_local(p) for p in papers))
+    for p in papers:
+        assert await db.is_paper_stored(p['id']) is True
+    assert await db.count_papers() == 5
+
+
+@pytest.mark.asyncio
+async def test_paper_rows_are_slotted(db):
+    await db.store_paper_local({
+        'id': '2301.00001', 'title': 'Test Paper', 'abstract': 'Abstract',
+        'authors': ['John Doe', 'Jane Smith'], 'categories': ['cs.LG', 'cs.AI'],
+    })
+    paper = await db.get_paper_by_id('2301.00001')
+    assert paper.title == 'Test Paper'
+    assert paper['authors'] == ['John Doe', 'Jane Smith']
+    assert paper.get('categories') == ['cs.LG', 'cs.AI']
+    assert paper.as_dict()['id'] == '2301.00001'
+    assert not hasattr(paper, '__dict__')
+    # Only dataclass fields are mapping keys, not methods
+    assert paper.get('as_dict') is None
+    assert paper.get('get', 'missing') == 'missing'
+    assert 'as_dict' not in paper and 'title' in paper
+    with pytest.raises(KeyError):
+        paper['as_dict']
+
+
+@pytest.mark.asyncio
+async def test_similarity_corpus_tokens(db):
+    await db.store_paper_local({
+        'id': '2301.00001', 'title': 'Attention Transformers',
+        'abstract': 'Sparse attention for long sequences',
+    })
+    [(paper, tokens)] = await db.get_similarity_corpus()
+    assert paper == {'id': '2301.00001', 'title': 'Attention Transformers',
+                     'abstract': 'Sparse attention for long sequences'}
+    assert tokens == ['attention', 'transformers', 'sparse', 'attention', 'long', 'sequences']
+
+
+@pytest.mark.asyncio
+async def test_authors_with_commas_round_trip(db):
+    await db.store_paper_local({
+        'id': '2301.00001', 'title': 'Test Paper',
+        'authors': ['Smith, Jr., John', 'Doe, Jane'], 'categories': ['cs.LG'],
+    })
+    paper = await db.get_paper_by_id('2301.00001')
+    assert paper.authors == ['Smith, Jr., John', 'Doe, Jane']
+    assert await db.get_distinct_categories() == ['cs.LG']
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_uses_fulltext_index(db):
+    await db.store_paper_local({'id': '1', 'title': 'Attention Is All You Need', 'abstract': 'Transformers'})
+    await db.store_paper_local({'id': '2', 'title': 'Graph Neural Networks', 'abstract': 'Message passing',
+                                'authors': ['Petar Velickovic']})
+    papers = await db.get_recent_papers(keyword='transformer')
+    assert [p.id for p in papers] == ['1']
+    assert await db.count_papers(keyword='graph neural') == 1
+    assert await db.count_papers(keyword='"quoted"') == 0
+    assert await db.count_papers(keyword='velickovic') == 1
+
+
+@pytest.mark.asyncio
+async def test_store_papers_local_batch(seeded_db):
+    await seeded_db.store_papers_local_batch([dict(p) for p in SEED_PAPERS])  # duplicates are ignored
+    assert await seeded_db.count_papers() == 5
+    assert await seeded_db.is_paper_stored('2300.00001') is True
+
+
+@pytest.mark.asyncio
+async def test_reads_use_query_only_connections(db):
+    await db.store_paper_local({'id': '2304.00001', 'title': 'Reader visibility'})
+    assert (await db.get_paper_by_id('2304.00001')).title == 'Reader visibility'
+    reader = await db._reader()
+    assert reader is not db._conn
+    cursor = await reader.execute("PRAGMA query_only")
+    assert (await cursor.fetchone())[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_guild_settings_cache_invalidated_on_write(db):
+    assert (await db.get_guild_settings(123))['categories'] == []
+    await db.set_guild_categories(123, ['cs.LG', 'cs.AI'])
+    assert (await db.get_guild_settings(123))['categories'] == ['cs.LG', 'cs.AI']
+    await db.update_last_fetch_time()
+    first = await db.get_last_fetch_time()
+    assert await db.get_last_fetch_time() == first
+
+
+@pytest.mark.asyncio
+async def test_global_stats_counters(db):
+    await db.add_subscription(1, 1, "attention")
+    await db.add_subscription(1, 2, "attention")
+    await db.add_subscription(1, 1, "graphs")
+    await db.store_papers_local_batch([{'id': 'a', 'title': 'A'}, {'id': 'b', 'title': 'B'}])
+    assert await db.vote_paper('a', 1) == 1
+    assert await db.vote_paper('b', -2) == -2
+    assert await db.get_paper_score('b') == -2
+    await db.remove_subscription(1, 1, "graphs")
+    await db.remove_subscription(1, 1, "attention")
+    stats = await db.get_global_stats()
+    assert stats['total_papers'] == 2
+    assert stats['total_subscriptions'] == 1
+    assert stats['total_votes'] == 3
+
+
+@pytest.mark.asyncio
+async def test_category_filter_matches_exactly(db):
+    await db.store_papers_local_batch([
+        {'id': 'a', 'title': 'A', 'categories': ['cs.LG', 'stat.ML']},
+        {'id': 'b', 'title': 'B', 'categories': ['cs.LGX']},
+    ])
+    assert [p.id for p in await db.get_recent_papers(category='cs.LG')] == ['a']
+    assert await db.count_papers(category='stat.ML') == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_ids(seeded_db):
+    seeded_db._seen_papers.clear()
+    assert await seeded_db.get_stored_ids(['2300.00000', '2300.00002', 'missing']) == {'2300.00000', '2300.00002'}
+
+
+@pytest.mark.asyncio
+async def test_papers_page_carries_total(seeded_db):
+    papers, total = await seeded_db.get_papers_page(limit=2, offset=2, sort="title")
+    assert [p.id for p in papers] == ['2300.00002', '2300.00003']
+    assert total == 5
+    assert await seeded_db.get_papers_page(limit=2, offset=10) == ([], 5)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_invalidated_by_writes(db):
+    assert await db.get_distinct_categories() == []
+    assert (await db.get_global_stats())['total_papers'] == 0
+    await db.store_paper_local({'id': 'a', 'title': 'A', 'categories': ['cs.CL']})
+    assert await db.get_distinct_categories() == ['cs.CL']
+    assert (await db.get_global_stats())['total_papers'] == 1
+    await db.add_bookmark('a', 'Later')
+    assert await db.get_collections() == [{'name': 'Later', 'count': 1}]
+    await db.remove_bookmark('a', 'Later')
+    assert await db.get_collections() == []
+
+
+@pytest.mark.asyncio
+async def test_vote_counters_follow_changed_votes(db):
+    await db.store_paper({'id': '2307.00001', 'title': 'Votes'}, 123, 456, 789)
+    await db.add_vote('2307.00001', 111, 123, 456, 'upvote')
+    await db.add_vote('2307.00001', 222, 123, 456, 'maybe')
+    await db.add_vote('2307.00001', 111, 123, 456, 'downvote')  # changes the earlier upvote
+    assert await db.get_vote_summary('2307.00001') == {'upvotes': 0, 'downvotes': 1, 'maybe': 1}
+    assert await db.get_vote_summary('unknown') == {'upvotes': 0, 'downvotes': 0, 'maybe': 0}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_the_writer(db):
+    await asyncio.gather(
+        *(db.add_subscription(1, 1, f"kw{i}") for i in range(10)),
+        *(db.store_paper_local({'id': f'2308.0000{i}', 'title': f'Paper {i}'}) for i in range(5)),
+        db.store_paper({'id': '2308.00009', 'title': 'Posted'}, 1, 1, 99),
+    )
+    assert len(await db.get_channel_subscriptions(1, 1)) == 10
+    assert await db.count_papers() == 6
+    assert not db._conn.in_transaction
+
+
+@pytest.mark.asyncio
+async def test_top_papers_use_epoch_posted_at(db):
+    await db.store_paper({'id': '2309.00001', 'title': 'Top'}, 123, 456, 789)
+    await db.add_vote('2309.00001', 111, 123, 456, 'upvote')
+    conn = await db._get_conn()
+    cursor = await conn.execute("SELECT typeof(posted_at) FROM posted_papers")
+    assert (await cursor.fetchone())[0] == 'integer'
+    top = await db.get_top_papers(123, 456, days=1)
+    assert [p['id'] for p in top] == ['2309.00001']
+
+
+@pytest.mark.asyncio
+async def test_malformed_paper_does_not_fail_others(db):
+    results = await asyncio.gather(
+        db.store_paper_local({'id': '2313.00001', 'title': 'Good'}),
+        db.store_paper_local({'id': '2313.00002'}),
+        return_exceptions=True,
+    )
+    assert results[0] is None
+    assert isinstance(results[1], KeyError)
+    assert await db.is_paper_stored('2313.00001') is True
+    assert await db.count_papers() == 1
+
+
+# Schema and row encoding written by the original, unversioned DatabaseManager
+_BASELINE_SCHEMA = """
+    CREATE TABLE subscriptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        guild_id INTEGER NOT NULL DEFAULT 0,
+        channel_id INTEGER NOT NULL DEFAULT 0,
+        keyword TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(guild_id, channel_id, keyword)
+    );
+    CREATE TABLE papers (
+        id TEXT PRIMARY KEY, title TEXT NOT NULL, abstract TEXT, authors TEXT, published TEXT,
+        categories TEXT, primary_category TEXT, url TEXT, pdf_url TEXT, summary TEXT,
+        matched_keywords TEXT, score INTEGER DEFAULT 0, fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+    CREATE TABLE bookmarks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, paper_id TEXT NOT NULL,
+        collection TEXT DEFAULT 'Reading List', notes TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (paper_id) REFERENCES papers(id), UNIQUE(paper_id, collection)
+    );
+    CREATE TABLE digest_config (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL CHECK(type IN ('email', 'webhook')),
+        target TEXT NOT NULL, keywords TEXT, categories TEXT, schedule TEXT DEFAULT 'daily',
+        send_hour INTEGER DEFAULT 9, enabled INTEGER DEFAULT 1, last_sent TIMESTAMP,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX idx_papers_fetched ON papers(fetched_at DESC);
+    CREATE INDEX idx_papers_score ON papers(score DESC);
+    CREATE INDEX idx_subscriptions_kw ON subscriptions(keyword);
+    CREATE INDEX idx_bookmarks_paper ON bookmarks(paper_id);
+    CREATE INDEX idx_bookmarks_collection ON bookmarks(collection);
+    INSERT INTO papers (id, title, abstract, authors, published, categories, primary_category,
+                        url, pdf_url, summary, matched_keywords, score)
+    VALUES ('2201.00001', 'Old Paper', 'Stored by the first release.', 'Ada Lovelace,Alan Turing',
+            '2022-01-01T00:00:00Z', 'cs.LG,stat.ML', 'cs.LG', '', '', '', 'gnn', 2);
+    INSERT INTO subscriptions (guild_id, channel_id, keyword) VALUES (0, 0, 'gnn');
+    INSERT INTO bookmarks (paper_id) VALUES ('2201.00001');
+    INSERT INTO metadata (key, value) VALUES ('last_fetch_time', '2022-01-02T03:04:05');
+"""
+
+
+@pytest.mark.asyncio
+async def test_opens_database_from_first_release(tmp_path):
+    import sqlite3
+    from datetime import datetime
+    path = str(tmp_path / "baseline.db")
+    with sqlite3.connect(path) as raw:
+        raw.executescript(_BASELINE_SCHEMA)
+    raw.close()
+
+    db = DatabaseManager(path)
+    await db.initialize()
+    try:
+        paper = await db.get_paper_by_id('2201.00001')
+        assert paper.authors == ['Ada Lovelace', 'Alan Turing']
+        assert paper.categories == ['cs.LG', 'stat.ML']
+        assert paper.score == 2
+        assert [p.id for p in await db.get_recent_papers(category='stat.ML')] == ['2201.00001']
+        assert [p.id for p in await db.get_recent_papers(keyword='Turing')] == ['2201.00001']
+        assert await db.get_vote_summary('2201.00001') == {'upvotes': 0, 'downvotes': 0, 'maybe': 0}
+        assert await db.get_last_fetch_time() == datetime(2022, 1, 2, 3, 4, 5)
+        stats = await db.get_global_stats()
+        assert (stats['total_papers'], stats['total_subscriptions'], stats['total_votes']) == (1, 1, 2)
+        assert len(await db.get_bookmarks()) == 1
+        conn = await db._get_conn()
+        cursor = await conn.execute("SELECT authors FROM papers")
+        assert (await cursor.fetchone())[0] == '["Ada Lovelace", "Alan Turing"]'
+    finally:
+        await db.close()
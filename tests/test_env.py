@@ -0,0 +1,18 @@
+"""Unit tests for environment settings."""
+import pytest
+
+from arxivscribe.env import Env
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1", True), ("true", True), ("YES", True),
+    ("0", False), ("false", False), ("", False),
+])
+def test_config_cache_flag(monkeypatch, value, expected):
+    monkeypatch.setenv("ARXIVSCRIBE_CONFIG_CACHE", value)
+    assert Env.from_environ().config_cache is expected
+
+
+def test_config_cache_off_when_unset(monkeypatch):
+    monkeypatch.delenv("ARXIVSCRIBE_CONFIG_CACHE", raising=False)
+    assert Env.from_environ().config_cache is False
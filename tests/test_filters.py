@@ -76,3 +76,24 @@ def test_filter_papers_by_keywords():
     assert len(filtered) == 2
     assert filtered[0][0]['title'] == 'Attention in Transformers'
     assert filtered[1][0]['title'] == 'Graph Neural Networks'
+
+
+def test_overlapping_keywords_all_match():
+    """Keywords that share a prefix or overlap are each reported."""
+    paper = {'title': 'Neural Network Attention', 'abstract': 'graph neural networks'}
+    matched = KeywordFilter.paper_matches_keywords(
+        paper,
+        ['neural', 'neural network', 'net', 'graph'],
+        fuzzy=True
+    )
+
+    assert matched == {'neural', 'neural network', 'graph'}
+
+
+def test_matching_reads_current_fields_without_mutating():
+    paper = {'title': 'Graph Neural Networks', 'abstract': 'Message passing.'}
+    assert KeywordFilter.paper_matches_keywords(paper, ['graph']) == {'graph'}
+    paper['title'] = 'Diffusion Models'
+    paper['summary'] = 'Uses transformers.'
+    assert KeywordFilter.paper_matches_keywords(paper, ['graph', 'transformers']) == {'transformers'}
+    assert set(paper) == {'title', 'abstract', 'summary'}
@@ -0,0 +1,64 @@
+"""Unit tests for TF-IDF paper similarity."""
+from array import array
+
+import pytest
+
+from arxivscribe import similarity_kernels
+from arxivscribe.similarity import PaperSimilarity
+
+
+CORPUS = [
+    {'id': '1', 'title': 'Graph neural networks for molecules', 'abstract': 'Message passing on molecular graphs.'},
+    {'id': '2', 'title': 'Graph transformers', 'abstract': 'Attention over graph structure and molecular data.'},
+    {'id': '3', 'title': 'Diffusion for images', 'abstract': 'Denoising diffusion generates images.'},
+    {'id': '4', 'title': 'Molecular property prediction', 'abstract': 'Predicting molecules with message passing.'},
+    {'id': '5', 'title': 'Reinforcement learning agents', 'abstract': 'Policy gradients for control.'},
+]
+
+
+def _assert_same_results(cached, expected):
+    assert [p['id'] for p, _ in cached] == [p['id'] for p, _ in expected]
+    for (_, got), (_, want) in zip(cached, expected):
+        assert got == pytest.approx(want, rel=1e-5)
+
+
+@pytest.fixture(params=['python', 'numba'])
+def kernel(request, monkeypatch):
+    monkeypatch.setattr(PaperSimilarity, '_cache', None)
+    if request.param == 'numba':
+        pytest.importorskip('numba')
+    else:
+        monkeypatch.setattr(similarity_kernels, 'njit', None)
+    return request.param
+
+
+def test_find_similar_cached_matches_find_similar(kernel):
+    target = CORPUS[0]
+    expected = PaperSimilarity.find_similar(target, CORPUS[1:], top_k=4)
+    # find_similar counts the target in its IDF corpus, so fit the same documents
+    PaperSimilarity.fit_corpus([target] + CORPUS[1:], version=1)
+    assert PaperSimilarity.corpus_version() == 1
+    cached = PaperSimilarity.find_similar_cached(target, top_k=4)
+    assert cached
+    _assert_same_results(cached, expected)
+
+
+def test_fit_corpus_accepts_pretokenized_docs(kernel):
+    tokens = [PaperSimilarity.tokenize(f"{p['title']} {p['abstract']}") for p in CORPUS]
+    tokens[2] = None  # tokenized by fit_corpus itself
+    PaperSimilarity.fit_corpus(CORPUS, version=2, tokens=tokens)
+    with_tokens = PaperSimilarity.find_similar_cached(CORPUS[3])
+    PaperSimilarity.fit_corpus(CORPUS, version=3)
+    _assert_same_results(with_tokens, PaperSimilarity.find_similar_cached(CORPUS[3]))
+
+
+def test_accumulate_dots_matches_python_kernel(kernel):
+    # Two terms over three docs: term 0 -> docs 0, 2; term 1 -> docs 1, 2
+    offsets = array('i', [0, 2, 4])
+    docs = array('i', [0, 2, 1, 2])
+    vals = array('f', [0.5, 0.25, 1.0, 2.0])
+    t_idx, t_val = array('i', [0, 1]), array('d', [2.0, 0.5])
+
+    out = array('d', bytes(8 * 3))
+    similarity_kernels.accumulate_dots(t_idx, t_val, offsets, docs, vals, out)
+    assert list(out) == pytest.approx([1.0, 0.5, 1.5])
@@ -0,0 +1,50 @@
+"""Unit tests for the LLM summarizer."""
+import pytest
+from unittest.mock import AsyncMock
+
+from arxivscribe.llm.summarizer import Summarizer
+from arxivscribe.storage.db import DatabaseManager
+
+
+@pytest.fixture
+async def db(tmp_path):
+    """Database backing the summary cache."""
+    db = DatabaseManager(str(tmp_path / "summaries.db"))
+    await db.initialize()
+    yield db
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_summaries_cached_in_llm_cache(db):
+    summarizer = Summarizer(provider='ollama', cache=db)
+    summarizer.provider.generate = AsyncMock(return_value='TLDR: Cached result.')
+    paper = {'id': '2310.00001', 'title': 'Cache', 'abstract': 'Abstract text.'}
+    assert await summarizer.summarize(paper) == 'Cached result.'
+    assert await summarizer.summarize(dict(paper)) == 'Cached result.'
+    assert summarizer.provider.generate.await_count == 1
+    assert await summarizer.summarize({**paper, 'abstract': 'Changed.'}) == 'Cached result.'
+    assert summarizer.provider.generate.await_count == 2  # cache miss
+
+
+@pytest.mark.asyncio
+async def test_empty_summaries_not_cached(db):
+    summarizer = Summarizer(provider='ollama', cache=db)
+    summarizer.provider.generate = AsyncMock(side_effect=['', 'Real summary.'])
+    paper = {'id': '2310.00002', 'title': 'Empty', 'abstract': 'Abstract text.'}
+    assert await summarizer.summarize(paper) == 'No summary available.'
+    assert await summarizer.summarize(paper) == 'Real summary.'
+    assert await summarizer.summarize(paper) == 'Real summary.'
+    assert summarizer.provider.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_cache_errors_fall_through():
+    cache = AsyncMock()
+    cache.get_cached_summary.side_effect = RuntimeError('database is locked')
+    cache.cache_summary.side_effect = RuntimeError('database is locked')
+    summarizer = Summarizer(provider='ollama', cache=cache)
+    summarizer.provider.generate = AsyncMock(return_value='Still summarized.')
+    paper = {'id': '2310.00003', 'title': 'Locked', 'abstract': 'Abstract text.'}
+    assert await summarizer.summarize(paper) == 'Still summarized.'
+    cache.cache_summary.assert_awaited_once()